@@ -0,0 +1,162 @@
+# Batch claim-candidate extraction (CPU only, no I/O).
+# Texts are split into sentences, filtered by length and then either matched
+# against one precompiled keyword pattern or scored by a linear classifier over
+# hashed TF-IDF features, all sentences of a batch in one vectorized call.
+# The module imports only the standard library at load time (numpy only when
+# the classifier is used) so it starts quickly in process-pool workers.
+
+import re
+import zlib
+
+MIN_WORDS = 5
+MAX_WORDS = 40
+
+# --- 1. Sentence segmentation ---
+# a run of terminators (plus closing quotes/brackets) followed by whitespace and
+# something that can start a sentence, or a line break between paragraphs
+_BOUNDARY = re.compile(r'[.!?]+["\'”’)\]]*\s+(?=["\'“‘(\[]?[A-Z0-9])|\n+')
+_ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'mt', 'gen', 'gov', 'sen', 'rep', 'lt', 'col',
+    'inc', 'ltd', 'co', 'corp', 'vs', 'etc', 'no', 'fig', 'approx', 'dept', 'est',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    'e.g', 'i.e', 'u.s', 'u.k', 'u.n', 'a.m', 'p.m',
+}
+
+def _is_abbreviation(text, end):
+    """True when the '.' at text[end] closes an abbreviation or an initial."""
+    word = text[max(0, end - 12):end].rsplit(None, 1)[-1:]
+    if not word:
+        return False
+    word = word[0].lstrip('("\'').lower()
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+def split_sentences(text):
+    sentences = []
+    start = 0
+    for m in _BOUNDARY.finditer(text or ''):
+        if text[m.start()] == '.' and _is_abbreviation(text, m.start()):
+            continue
+        sentence = text[start:m.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = m.end()
+    tail = (text or '')[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+def candidate_sentences(text):
+    """Sentences of MIN_WORDS..MAX_WORDS words, trailing terminator removed."""
+    out = []
+    for s in split_sentences(text):
+        if MIN_WORDS <= len(s.split()) <= MAX_WORDS:
+            out.append(s.rstrip('.!?'))
+    return out
+
+# --- 2. Keyword matcher ---
+# whole-word stems, so "because" / "security" / "banner" no longer match
+_CLAIM_TERMS = re.compile(
+    r'\b(?:caus(?:e|es|ed|ing)|prevent\w*|cur(?:e|es|ed|ing)|vaccin\w*|ban(?:s|ned|ning)?'
+    r'|laws?|immediately|proven|stud(?:y|ies)|research\w*)\b',
+    re.IGNORECASE,
+)
+
+def keyword_claims(sentences):
+    return [s for s in sentences if _CLAIM_TERMS.search(s)]
+
+# --- 3. Linear classifier over hashed TF-IDF features ---
+_TOKEN = re.compile(r'\w+')
+_models = {}
+
+def _hashed_counts(sentences, n_features, ngram):
+    """(rows, cols, counts) of the hashed unigram/bigram counts, one row per sentence."""
+    import numpy as np
+    rows, cols = [], []
+    for i, s in enumerate(sentences):
+        tokens = _TOKEN.findall(s.lower())
+        if ngram > 1:
+            tokens += [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+        rows.extend([i] * len(tokens))
+        cols.extend(zlib.crc32(t.encode('utf-8')) % n_features for t in tokens)
+    keys = np.asarray(rows, dtype=np.int64) * n_features + np.asarray(cols, dtype=np.int64)
+    keys, counts = np.unique(keys, return_counts=True)
+    return keys // n_features, keys % n_features, counts
+
+def _tfidf(rows, cols, counts, idf, n_rows):
+    import numpy as np
+    vals = (1.0 + np.log(counts)) * idf[cols]
+    norms = np.sqrt(np.bincount(rows, weights=vals * vals, minlength=n_rows))
+    return vals / np.where(norms > 0, norms, 1.0)[rows]
+
+class LinearClaimModel:
+    """Logistic regression over L2-normalized hashed TF-IDF features, stored as .npz."""
+
+    def __init__(self, weights, idf, bias=0.0, ngram=2):
+        self.weights = weights
+        self.idf = idf
+        self.bias = float(bias)
+        self.ngram = int(ngram)
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+        with np.load(path) as data:
+            return cls(data['weights'], data['idf'], data['bias'], data['ngram'])
+
+    def save(self, path):
+        import numpy as np
+        np.savez_compressed(path, weights=self.weights, idf=self.idf, bias=self.bias, ngram=self.ngram)
+
+    def features(self, sentences):
+        rows, cols, counts = _hashed_counts(sentences, len(self.weights), self.ngram)
+        return rows, cols, _tfidf(rows, cols, counts, self.idf, len(sentences))
+
+    def predict(self, sentences):
+        """Claim probability for every sentence."""
+        import numpy as np
+        if not sentences:
+            return np.zeros(0)
+        rows, cols, vals = self.features(sentences)
+        z = np.bincount(rows, weights=vals * self.weights[cols], minlength=len(sentences)) + self.bias
+        return 1.0 / (1.0 + np.exp(-z))
+
+    @classmethod
+    def train(cls, sentences, labels, n_features=2 ** 18, ngram=2, epochs=300, lr=4.0, l2=1e-4):
+        """Full-batch gradient descent on the log loss. `labels` are 0/1."""
+        import numpy as np
+        y = np.asarray(labels, dtype=np.float64)
+        m = len(sentences)
+        rows, cols, counts = _hashed_counts(sentences, n_features, ngram)
+        df = np.bincount(cols, minlength=n_features)
+        idf = (np.log((1.0 + m) / (1.0 + df)) + 1.0).astype(np.float32)
+        vals = _tfidf(rows, cols, counts, idf, m)
+        w = np.zeros(n_features)
+        b = 0.0
+        for _ in range(epochs):
+            z = np.bincount(rows, weights=vals * w[cols], minlength=m) + b
+            err = 1.0 / (1.0 + np.exp(-z)) - y
+            w -= lr * (np.bincount(cols, weights=vals * err[rows], minlength=n_features) / m + l2 * w)
+            b -= lr * err.mean()
+        return cls(w.astype(np.float32), idf, b, ngram)
+
+def load_model(path):
+    if path not in _models:
+        _models[path] = LinearClaimModel.load(path)
+    return _models[path]
+
+# --- 4. Batch entry point ---
+def extract_texts(texts, model_path=None, threshold=0.5):
+    """
+    Claim candidates for every text, in order. With `model_path` the sentences
+    of all texts are scored together by the linear model; otherwise the keyword
+    matcher is used.
+    """
+    per_text = [candidate_sentences(t) for t in texts]
+    if model_path is None:
+        return [keyword_claims(sentences) for sentences in per_text]
+    scores = load_model(model_path).predict([s for sentences in per_text for s in sentences])
+    out, i = [], 0
+    for sentences in per_text:
+        out.append([s for s, p in zip(sentences, scores[i:i + len(sentences)]) if p >= threshold])
+        i += len(sentences)
+    return out
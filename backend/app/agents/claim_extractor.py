@@ -1,45 +1,141 @@
 # This module extracts candidate claims from raw items using a small LLM or a heuristics pipeline.
 
-from transformers import pipeline
 from ..db import raw_items, claims
-from ..utils import now_iso
-import os
+from ..utils import now_iso, article_text
+from ..events import bus
+from ..coordination import claim_raw_items, renew_raw_items, held_filter
+from .. import metrics
+from ..cpu_pools import run_in_pool, pool_size
+from .dedup import LocalIndex, find_canonical, fingerprint
+from .claim_engine import candidate_sentences, extract_texts
+from bson import ObjectId
 from ..config import settings
 import asyncio
+import os
 
-# For production, use a more advanced claim-extraction model. Here we use a text2text pipeline prompt.
-# If OPENAI_API_KEY is provided you can call OpenAI or use a hosted HF model.
+# For production, use a more advanced claim-extraction model (CLAIM_EXTRACTOR=model).
+# transformers/torch are imported only when that extractor is first used, so the
+# API and the default heuristic extractor start without loading them.
 
-# Fallback: simple heuristics extractor
+_claim_model = None
 
-async def extract_from_text(text: str):
-    # simple sentence-based heuristics: short assertive sentences with keywords
-    sentences = [s.strip() for s in text.split('.') if s.strip()]
-    candidates = []
-    keywords = ['cause', 'prevent', 'cure', 'vaccine', 'ban', 'laws', 'immediately', 'proven', 'study', 'research']
-    for s in sentences:
-        if len(s.split()) < 5 or len(s.split()) > 40:
-            continue
-        if any(k in s.lower() for k in keywords):
-            candidates.append(s)
-    return candidates
+def _get_claim_model():
+    global _claim_model
+    if _claim_model is None:
+        from transformers import pipeline
+        _claim_model = pipeline('zero-shot-classification', model=settings.CLAIM_MODEL)
+    return _claim_model
 
-async def run_extractor(limit=50):
-    cursor = raw_items.find().sort('fetched_at', -1).limit(limit)
-    created = []
-    async for item in cursor:
-        full_text = item.get('meta', {}).get('full_text') or item.get('summary') or item.get('title')
-        if not full_text:
+# Heuristic ('heuristic') and linear-classifier ('linear') extraction run in
+# claim_engine over a whole batch at once: in a thread for normal batches and
+# split across a process pool once the batch text reaches EXTRACT_POOL_MIN_CHARS.
+
+_missing_model_warned = False
+
+def _linear_model_path():
+    global _missing_model_warned
+    if settings.CLAIM_EXTRACTOR != 'linear':
+        return None
+    if os.path.exists(settings.CLAIM_LINEAR_MODEL):
+        return settings.CLAIM_LINEAR_MODEL
+    if not _missing_model_warned:
+        _missing_model_warned = True
+        print(f"Claim model {settings.CLAIM_LINEAR_MODEL} not found, using keyword heuristics (see train_claim_classifier.py)")
+    return None
+
+async def extract_from_texts(texts):
+    """Claim candidates for every text, in order."""
+    args = (_linear_model_path(), settings.CLAIM_LINEAR_THRESHOLD)
+    workers = pool_size(settings.EXTRACT_WORKERS)
+    if workers < 2 or len(texts) < 2 or sum(len(t) for t in texts) < settings.EXTRACT_POOL_MIN_CHARS:
+        return await asyncio.to_thread(extract_texts, texts, *args)
+    step = -(-len(texts) // workers)
+    chunks = await asyncio.gather(*[
+        run_in_pool('claim-extract', 'process', workers, extract_texts, texts[i:i + step], *args)
+        for i in range(0, len(texts), step)
+    ])
+    return [found for chunk in chunks for found in chunk]
+
+async def extract_with_model(text: str):
+    # same sentence segmentation and length window as the heuristics, scored by the model
+    sentences = candidate_sentences(text)
+    if not sentences:
+        return []
+    classifier = await asyncio.to_thread(_get_claim_model)
+    labels = ['factual claim', 'opinion or other']
+    outputs = await asyncio.to_thread(classifier, sentences, candidate_labels=labels)
+    return [
+        s for s, o in zip(sentences, outputs)
+        if o['labels'][0] == labels[0] and o['scores'][0] >= settings.CLAIM_MODEL_THRESHOLD
+    ]
+
+async def extract_claims(texts):
+    """Claim candidates for every text, in order, with the configured CLAIM_EXTRACTOR."""
+    if settings.CLAIM_EXTRACTOR == 'model':
+        return await asyncio.gather(*[extract_with_model(t) for t in texts])
+    return await extract_from_texts(texts)
+
+def _item_text(item):
+    return article_text(item) or item.get('summary') or item.get('title')
+
+async def extract_batch(items):
+    """
+    Extracts claims from a batch of claimed raw items, writes them with one
+    bulk insert and marks the items as extracted. Items this worker no longer
+    holds are skipped. Returns the new claim docs.
+    """
+    texts = [_item_text(item) or '' for item in items]
+    with metrics.timed('extract'):
+        candidates = await extract_claims(texts)
+    # renewing the claim right before writing keeps it ours for the writes below
+    held = {item['_id'] for item in await renew_raw_items(items)}
+    docs = []
+    for item, found in zip(items, candidates):
+        if item['_id'] not in held:
             continue
-        candidates = await extract_from_text(full_text)
-        for c in candidates:
-            claim_doc = {
+        for c in found:
+            docs.append({
+                '_id': ObjectId(),
                 'raw_id': str(item['_id']),
                 'text': c,
                 'extracted_at': now_iso(),
-                'status': 'unverified'
-            }
-            res = await claims.insert_one(claim_doc)
-            claim_doc['_id'] = str(res.inserted_id)
-            created.append(claim_doc)
+                'status': 'unverified',
+                **fingerprint(c)
+            })
+
+    # near-duplicates point at the first claim seen with the same text,
+    # either already stored or earlier in this batch
+    with metrics.timed('dedup'):
+        stored = await asyncio.gather(*[find_canonical(d['text']) for d in docs])
+    batch_index = LocalIndex()
+    for d, canonical in zip(docs, stored):
+        h = int(d['simhash'], 16)
+        d['canonical_id'] = canonical or batch_index.find(h)
+        if d['canonical_id'] is None:
+            batch_index.add(h, str(d['_id']))
+
+    if docs:
+        await claims.insert_many(docs, ordered=False)
+        metrics.items_processed.inc(len(docs), kind='claim')
+    held_items = [item for item in items if item['_id'] in held]
+    if held_items:
+        await raw_items.update_many(held_filter(held_items), {'$set': {'extracted': True}})
+    for d in docs:
+        d['_id'] = str(d['_id'])
+    bus.emit('claim', docs)
+    return docs
+
+async def run_extractor(batch_size=None):
+    """
+    Processes every raw item not extracted yet, oldest first, in pages of
+    EXTRACT_BATCH_SIZE. Work is proportional to new items only. Items are
+    claimed first, so parallel runs split the backlog instead of repeating it.
+    """
+    batch_size = batch_size or settings.EXTRACT_BATCH_SIZE
+    created = []
+    while True:
+        items = await claim_raw_items(batch_size)
+        if not items:
+            break
+        created.extend(await extract_batch(items))
     return created
@@ -0,0 +1,117 @@
+# Near-duplicate claim detection.
+# Claims are fingerprinted with a 64-bit SimHash over word shingles. The hash is
+# split into 4 bands of 16 bits that are stored (and indexed) on each claim, so
+# any two hashes within 3 bits of each other share at least one band and can be
+# found with a single indexed $in query.
+
+import datetime
+import hashlib
+from ..config import settings
+from ..db import claims, verifications
+from ..utils import normalize_text
+from .evidence_store import hydrate_evidence
+
+SIMHASH_BITS = 64
+BAND_BITS = 16
+BANDS = SIMHASH_BITS // BAND_BITS
+
+def _shingles(text):
+    words = normalize_text(text).split()
+    if len(words) < 3:
+        return words
+    return [' '.join(words[i:i + 3]) for i in range(len(words) - 2)]
+
+def simhash(text):
+    weights = [0] * SIMHASH_BITS
+    for feature in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    value = 0
+    for bit, w in enumerate(weights):
+        if w > 0:
+            value |= 1 << bit
+    return value
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+def bands(h):
+    # band index is folded into the value so bands never collide with each other
+    mask = (1 << BAND_BITS) - 1
+    return [(i << BAND_BITS) | ((h >> (i * BAND_BITS)) & mask) for i in range(BANDS)]
+
+def fingerprint(text):
+    """Fields stored on a claim document for near-duplicate lookups."""
+    h = simhash(text)
+    return {'simhash': format(h, '016x'), 'simhash_bands': bands(h)}
+
+class LocalIndex:
+    """Band index for claims of the current batch that are not in Mongo yet."""
+    def __init__(self):
+        self._bands = {}
+
+    def find(self, h):
+        for b in bands(h):
+            for other, claim_id in self._bands.get(b, []):
+                if hamming(h, other) <= settings.DEDUP_MAX_HAMMING:
+                    return claim_id
+        return None
+
+    def add(self, h, claim_id):
+        for b in bands(h):
+            self._bands.setdefault(b, []).append((h, claim_id))
+
+async def find_canonical(text):
+    """
+    Returns the id (str) of the canonical claim whose text is a near-duplicate
+    of `text`, or None when the claim is new.
+    """
+    h = simhash(text)
+    best, best_dist = None, settings.DEDUP_MAX_HAMMING + 1
+    cursor = claims.find(
+        {'simhash_bands': {'$in': bands(h)}},
+        {'simhash': 1, 'canonical_id': 1}
+    ).limit(settings.DEDUP_MAX_CANDIDATES)
+    async for c in cursor:
+        dist = hamming(h, int(c['simhash'], 16))
+        if dist < best_dist:
+            best, best_dist = c, dist
+    if best is None:
+        return None
+    return best.get('canonical_id') or str(best['_id'])
+
+async def fresh_verification(canonical_id):
+    """
+    Most recent original (not reused) verification of a canonical claim inside
+    the freshness window. Fallbacks written while the LLM was down never count.
+    """
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=settings.DEDUP_FRESHNESS_HOURS)
+    return await verifications.find_one(
+        {'canonical_id': canonical_id, 'reused_from': None, 'llm_failed': {'$ne': True},
+         'checked_at': {'$gte': cutoff.isoformat() + 'Z'}},
+        sort=[('checked_at', -1)]
+    )
+
+def result_from_verification(ver):
+    """Shapes a stored verification like the output of verify_claim_text."""
+    reasons = ver.get('reasons') or []
+    return {
+        'verdict': ver['verdict'],
+        'score': ver['score'],
+        'evidence': ver.get('evidence', []),
+        'reasons': reasons,
+        'summary': ver.get('summary') or (reasons[0] if reasons else "Verified by AI."),
+        'reused_from': str(ver['_id'])
+    }
+
+async def cached_result(text):
+    """Returns a fresh verification result for a near-duplicate of `text`, or None."""
+    canonical_id = await find_canonical(text)
+    if canonical_id is None:
+        return None
+    ver = await fresh_verification(canonical_id)
+    if not ver:
+        return None
+    await hydrate_evidence([ver])
+    return result_from_verification(ver)
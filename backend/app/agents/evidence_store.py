@@ -0,0 +1,63 @@
+# Content-addressed evidence store.
+# Every evidence item (title, snippet, link, source) is stored once in the
+# `evidence` collection under a hash of its normalized link. Verifications only
+# keep `evidence_refs` — the id plus the per-claim relevance — and are hydrated
+# back to the full evidence list with one $in query per page of results.
+
+import datetime
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from pymongo import UpdateOne
+from ..db import evidence
+
+STORED_FIELDS = ('title', 'snippet', 'link', 'source')
+
+def normalize_link(link):
+    """Lowercases scheme/host and drops fragments, tracking params and trailing slashes."""
+    parts = urlsplit((link or '').strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.lower().startswith('utm_')])
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+def evidence_key(link):
+    return hashlib.blake2b(normalize_link(link).encode('utf-8'), digest_size=16).hexdigest()
+
+def to_refs(items):
+    return [{'id': evidence_key(e.get('link')), 'relevance': e.get('relevance')} for e in items]
+
+async def store_evidence(items):
+    """
+    Upserts evidence items (first copy wins) and returns their refs in input
+    order. One unordered bulk write per call.
+    """
+    if not items:
+        return []
+    now = datetime.datetime.utcnow()
+    ops = {}
+    for e in items:
+        key = evidence_key(e.get('link'))
+        if key not in ops:
+            doc = {k: e.get(k) for k in STORED_FIELDS}
+            ops[key] = UpdateOne({'_id': key}, {'$setOnInsert': {**doc, 'first_seen': now}}, upsert=True)
+    await evidence.bulk_write(list(ops.values()), ordered=False)
+    return to_refs(items)
+
+async def hydrate_evidence(docs):
+    """
+    Replaces `evidence_refs` with the full `evidence` list on every doc, in
+    place, using a single $in lookup. Docs that still embed evidence (not
+    migrated yet) are left as they are. Returns docs.
+    """
+    ids = {r['id'] for d in docs for r in d.get('evidence_refs') or []}
+    found = {}
+    if ids:
+        async for e in evidence.find({'_id': {'$in': list(ids)}}):
+            found[e['_id']] = {k: e.get(k) for k in STORED_FIELDS}
+    for d in docs:
+        refs = d.pop('evidence_refs', None)
+        if refs is None:
+            continue
+        d['evidence'] = [
+            {**found[r['id']], 'relevance': r.get('relevance')} for r in refs if r['id'] in found
+        ]
+    return docs
@@ -1,46 +1,111 @@
 import aiohttp
 import asyncio
+from urllib.parse import urlparse
 from ..config import settings
 from ..db import raw_items
-from ..utils import now_iso
-from bs4 import BeautifulSoup
+from ..utils import now_iso, compress_text
+from ..http_client import get_session
+from ..resilience import request_json, UpstreamError
+from ..cpu_pools import run_in_pool, pool_size
+from ..events import bus
+from .. import metrics
+from .local_index import index_items
+from .html_text import extract_paragraphs
 
-# Simple NewsAPI fetcher + basic scraping for additional metadata
+# Simple NewsAPI fetcher + basic scraping for additional metadata.
+# Article pages are streamed with a byte cap and parsed in a worker pool, so
+# large pages never block the event loop (and the API) while they are parsed.
 
-NEWSAPI_URL = 'https://newsapi.org/v2/top-headlines'
+MAX_PARAGRAPHS = 20
+HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+async def read_capped(resp):
+    """Reads the body in chunks and stops at SCRAPE_MAX_BYTES."""
+    chunks, size = [], 0
+    async for chunk in resp.content.iter_chunked(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= settings.SCRAPE_MAX_BYTES:
+            break
+    return b''.join(chunks)[:settings.SCRAPE_MAX_BYTES]
+
+async def parse_article(body, encoding):
+    with metrics.timed('parse'):
+        return await run_in_pool('html-parse', settings.SCRAPE_PARSE_POOL, pool_size(settings.SCRAPE_PARSE_WORKERS),
+                                 extract_paragraphs, body, encoding, MAX_PARAGRAPHS)
+
+async def scrape_article(session, item, slots, host_slots):
+    """
+    Fills item['body_z'] (compressed article text) from the article page.
+    `slots` caps scrapes for the whole cycle, `host_slots` caps each publisher.
+    """
+    host = urlparse(item['url']).netloc.lower()
+    if host not in host_slots:
+        host_slots[host] = asyncio.Semaphore(settings.FETCH_PER_HOST_CONCURRENCY)
+    try:
+        # per-host slot first, so pages queued behind a busy host hold no global slot
+        async with host_slots[host], slots:
+            with metrics.timed('scrape'):
+                scrape_timeout = aiohttp.ClientTimeout(total=settings.SCRAPE_TIMEOUT_SEC)
+                async with session.get(item['url'], timeout=scrape_timeout) as r:
+                    if r.status != 200 or r.content_type not in HTML_TYPES:
+                        return
+                    body = await read_capped(r)
+                    encoding = r.charset
+                paragraphs = await parse_article(body, encoding)
+                if paragraphs:
+                    item['body_z'] = compress_text('\n'.join(paragraphs))
+    except Exception:
+        pass
+
+async def scrape_articles(session, items):
+    """
+    Scrapes all articles concurrently. Anything still running when the cycle
+    deadline expires is cancelled and stored without full text.
+    """
+    slots = asyncio.Semaphore(settings.FETCH_CONCURRENCY)
+    host_slots = {}
+    tasks = [asyncio.create_task(scrape_article(session, item, slots, host_slots)) for item in items if item['url']]
+    if not tasks:
+        return
+    done, pending = await asyncio.wait(tasks, timeout=settings.FETCH_DEADLINE_SEC)
+    for t in pending:
+        t.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        print(f'Fetch deadline reached, skipped {len(pending)} slow article(s)')
 
 async def fetch_news():
     if not settings.NEWSAPI_KEY:
         print('NEWSAPI_KEY not set, skipping news fetch')
         return []
     params = {'apiKey': settings.NEWSAPI_KEY, 'language': 'en', 'pageSize': 20}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(NEWSAPI_URL, params=params, timeout=30) as resp:
-            data = await resp.json()
+    try:
+        with metrics.timed('fetch_headlines'):
+            data = await request_json('newsapi', 'GET', f'{settings.NEWSAPI_API_BASE}/top-headlines', params=params)
+    except UpstreamError as e:
+        print(f'News fetch failed: {e}')
+        return []
+    session = get_session()
     articles = data.get('articles', [])
-    to_store = []
-    for a in articles:
-        item = {
-            'source': a.get('source', {}).get('name', 'newsapi'),
-            'url': a.get('url'),
-            'title': a.get('title'),
-            'summary': a.get('description'),
-            'fetched_at': now_iso(),
-            'meta': {}
-        }
-        # optionally scrape the article for more text
-        if item['url']:
-            try:
-                async with aiohttp.ClientSession() as s:
-                    async with s.get(item['url'], timeout=15) as r:
-                        if r.status == 200:
-                            txt = await r.text()
-                            soup = BeautifulSoup(txt, 'html.parser')
-                            paragraphs = [p.get_text() for p in soup.find_all('p')]
-                            item['meta']['full_text'] = '\n'.join(paragraphs[:20])
-            except Exception:
-                pass
-        res = await raw_items.insert_one(item)
-        item['_id'] = str(res.inserted_id)
-        to_store.append(item)
+    to_store = [{
+        'source': a.get('source', {}).get('name', 'newsapi'),
+        'url': a.get('url'),
+        'title': a.get('title'),
+        'summary': a.get('description'),
+        'fetched_at': now_iso(),
+        'extracted': False,
+        'meta': {}
+    } for a in articles]
+    if not to_store:
+        return []
+    # optionally scrape the articles for more text
+    await scrape_articles(session, to_store)
+    # one bulk write per cycle
+    await raw_items.insert_many(to_store, ordered=False)
+    metrics.items_processed.inc(len(to_store), kind='raw_item')
+    for item in to_store:
+        item['_id'] = str(item['_id'])
+    bus.emit('raw_item', to_store)
+    await index_items(to_store)
     return to_store
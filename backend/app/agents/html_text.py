@@ -0,0 +1,64 @@
+# Article text extraction from raw HTML bytes.
+# A streaming html.parser handler collects <p> text without building a tree
+# and stops as soon as enough paragraphs are found. The module imports only
+# the standard library so it loads quickly in process-pool workers.
+
+import codecs
+import re
+from html.parser import HTMLParser
+
+_WS = re.compile(r'\s+')
+_SKIP = {'script', 'style', 'noscript', 'template'}
+
+class _Done(Exception):
+    pass
+
+class ParagraphParser(HTMLParser):
+    def __init__(self, max_paragraphs):
+        super().__init__(convert_charrefs=True)
+        self.max_paragraphs = max_paragraphs
+        self.paragraphs = []
+        self._current = None
+        self._skip = 0
+
+    def _flush(self):
+        if self._current is not None:
+            text = _WS.sub(' ', ''.join(self._current)).strip()
+            self._current = None
+            if text:
+                self.paragraphs.append(text)
+                if len(self.paragraphs) >= self.max_paragraphs:
+                    raise _Done()
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP:
+            self._skip += 1
+        elif tag == 'p':
+            # an unclosed <p> ends where the next one starts
+            self._flush()
+            self._current = []
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP:
+            self._skip = max(0, self._skip - 1)
+        elif tag == 'p':
+            self._flush()
+
+    def handle_data(self, data):
+        if self._current is not None and not self._skip:
+            self._current.append(data)
+
+def extract_paragraphs(body, encoding='utf-8', max_paragraphs=20):
+    """Text of the first `max_paragraphs` non-empty <p> elements of an HTML document (bytes)."""
+    try:
+        codecs.lookup(encoding or 'utf-8')
+    except LookupError:
+        encoding = 'utf-8'
+    parser = ParagraphParser(max_paragraphs)
+    try:
+        parser.feed(body.decode(encoding or 'utf-8', errors='replace'))
+        parser.close()
+        parser._flush()
+    except _Done:
+        pass
+    return parser.paragraphs
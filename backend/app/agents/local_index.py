@@ -0,0 +1,151 @@
+# Local full-text search over our own ingested articles.
+# An inverted index (term -> {doc: term frequency}) with BM25 scoring, kept in
+# memory, updated by the fetcher as items are ingested and snapshotted to
+# LOCAL_INDEX_PATH. Other processes sharing that path (same host or a shared
+# volume) pick up a newer snapshot on their next search, so replicas serve the
+# same corpus without rebuilding it. Snapshots
+# are pickled and written in a thread; the index is only changed while holding
+# _save_lock, so the pickler never sees it mid-update.
+
+import asyncio
+import math
+import os
+import pickle
+import time
+from collections import Counter
+from ..config import settings
+from ..db import raw_items
+from ..utils import article_text
+from .rerank import tokenize, BM25_K1, BM25_B
+
+SNIPPET_CHARS = 300
+
+class InvertedIndex:
+    def __init__(self):
+        self.postings = {}
+        self.doc_len = {}
+        self.docs = {}
+        self.total_len = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, doc_id, text, meta):
+        if doc_id in self.docs:
+            return False
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        length = sum(terms.values())
+        self.doc_len[doc_id] = length
+        self.total_len += length
+        self.docs[doc_id] = meta
+        return True
+
+    def search(self, query, k=5):
+        n = len(self.docs)
+        if not n:
+            return []
+        avgdl = self.total_len / n or 1
+        scores = Counter()
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[doc_id] / avgdl)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return [self.docs[doc_id] for doc_id, _ in scores.most_common(k)]
+
+_index = InvertedIndex()
+_snapshot_mtime = 0.0
+_last_check = 0.0
+_save_lock = asyncio.Lock()
+
+def _doc_for(item):
+    full_text = article_text(item)
+    text = ' '.join(filter(None, [item.get('title'), item.get('summary'), full_text]))
+    meta = {
+        'title': item.get('title'),
+        'snippet': item.get('summary') or full_text[:SNIPPET_CHARS],
+        'link': item.get('url'),
+        'source': f"{item.get('source') or 'Archive'} (local archive)",
+    }
+    return str(item['_id']), text, meta
+
+def _load_snapshot():
+    global _index, _snapshot_mtime
+    path = settings.LOCAL_INDEX_PATH
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return False
+    if mtime <= _snapshot_mtime:
+        return False
+    with open(path, 'rb') as f:
+        _index = pickle.load(f)
+    _snapshot_mtime = mtime
+    return True
+
+def _write_snapshot(index):
+    path = settings.LOCAL_INDEX_PATH
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return os.path.getmtime(path)
+
+async def _save(index):
+    # caller holds _save_lock
+    global _snapshot_mtime
+    _snapshot_mtime = await asyncio.to_thread(_write_snapshot, index)
+
+async def index_items(items):
+    """Adds newly ingested raw items to the index and persists it."""
+    if not settings.LOCAL_INDEX_ENABLED:
+        return 0
+    async with _save_lock:
+        # start from the newest snapshot: this process may have just taken
+        # over fetching with a copy older than the one on disk
+        await asyncio.to_thread(_load_snapshot)
+        index = _index
+        added = 0
+        for item in items:
+            if item.get('url'):
+                added += index.add(*_doc_for(item))
+        if added:
+            await _save(index)
+    return added
+
+async def load_index():
+    """
+    Loads the on-disk snapshot, or builds the index from raw_items when there
+    is none. Called once at startup.
+    """
+    if not settings.LOCAL_INDEX_ENABLED:
+        return
+    async with _save_lock:
+        if await asyncio.to_thread(_load_snapshot):
+            print(f"Local index loaded: {len(_index)} docs")
+            return
+        index = _index
+        added = 0
+        async for item in raw_items.find({'url': {'$ne': None}}):
+            added += index.add(*_doc_for(item))
+        if added:
+            await _save(index)
+    print(f"Local index built from raw_items: {added} docs")
+
+async def search_local(query):
+    if not settings.LOCAL_INDEX_ENABLED:
+        return []
+    global _last_check
+    now = time.monotonic()
+    if now - _last_check > settings.LOCAL_INDEX_RELOAD_SEC and not _save_lock.locked():
+        # another process may have written a newer snapshot
+        _last_check = now
+        async with _save_lock:
+            await asyncio.to_thread(_load_snapshot)
+    return [dict(doc) for doc in _index.search(query, k=settings.LOCAL_INDEX_RESULTS)]
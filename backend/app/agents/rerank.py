@@ -0,0 +1,93 @@
+# Local relevance stage between search and LLM scoring.
+# Evidence is ranked against the claim with BM25 (no network, no model) and
+# only the most relevant items that fit LLM_EVIDENCE_TOKEN_BUDGET go into the
+# verification prompt.
+
+import math
+from collections import Counter
+from ..config import settings
+from ..utils import normalize_text
+from .. import metrics
+
+STOPWORDS = frozenset(
+    'a an and are as at be but by for from has have he her his i if in into is it its '
+    'of on or our she so that the their them there they this to was we were what when '
+    'which who will with you your'.split()
+)
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_savings = {'claims': 0, 'items_before': 0, 'items_after': 0, 'tokens_before': 0, 'tokens_after': 0}
+
+def tokenize(text):
+    return [t for t in normalize_text(text).split() if t not in STOPWORDS]
+
+def bm25_scores(query_terms, docs_terms):
+    n = len(docs_terms)
+    avgdl = sum(len(d) for d in docs_terms) / n if n else 0
+    df = Counter(term for d in docs_terms for term in set(d))
+    scores = []
+    for d in docs_terms:
+        tf = Counter(d)
+        score = 0.0
+        for q in set(query_terms):
+            if q not in tf:
+                continue
+            idf = math.log(1 + (n - df[q] + 0.5) / (df[q] + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * len(d) / (avgdl or 1))
+            score += idf * tf[q] * (BM25_K1 + 1) / (tf[q] + norm)
+        scores.append(score)
+    return scores
+
+def rank_evidence(claim, evidence):
+    """
+    Evidence sorted by BM25 relevance to the claim (ties keep search order),
+    each copy carrying its score as 'relevance'.
+    """
+    if not evidence:
+        return []
+    docs = [tokenize(f"{e.get('title') or ''} {e.get('snippet') or ''}") for e in evidence]
+    scores = bm25_scores(tokenize(claim), docs)
+    order = sorted(range(len(evidence)), key=lambda i: scores[i], reverse=True)
+    return [{**evidence[i], 'relevance': round(scores[i], 3)} for i in order]
+
+def estimate_tokens(e):
+    # ~4 characters per token plus the "Source n (...)" framing
+    text = f"{e.get('source') or ''}{e.get('title') or ''}{e.get('snippet') or ''}"
+    return len(text) // 4 + 8
+
+def fit_to_budget(ranked):
+    """
+    Takes evidence in relevance order until LLM_EVIDENCE_TOKEN_BUDGET is
+    reached, cutting long snippets (e.g. Reddit selftext) to
+    LLM_EVIDENCE_SNIPPET_CHARS. Returns the evidence for the prompt.
+    """
+    cap = settings.LLM_EVIDENCE_SNIPPET_CHARS
+    selected, used = [], 0
+    for e in ranked:
+        snippet = e.get('snippet') or ''
+        if len(snippet) > cap:
+            e = {**e, 'snippet': snippet[:cap].rsplit(' ', 1)[0] + '...'}
+        cost = estimate_tokens(e)
+        if used + cost > settings.LLM_EVIDENCE_TOKEN_BUDGET:
+            break
+        selected.append(e)
+        used += cost
+
+    before = sum(estimate_tokens(e) for e in ranked)
+    _savings['claims'] += 1
+    _savings['items_before'] += len(ranked)
+    _savings['items_after'] += len(selected)
+    _savings['tokens_before'] += before
+    _savings['tokens_after'] += used
+    if settings.TRACE_CLAIMS:
+        # totals are in /api/evidence/stats and misinfo_evidence_tokens_total
+        print(f"Evidence: {len(ranked)} -> {len(selected)} items, ~{before} -> ~{used} prompt tokens")
+    return selected
+
+def savings_stats():
+    return dict(_savings, tokens_saved=_savings['tokens_before'] - _savings['tokens_after'])
+
+metrics.collector('misinfo_evidence_tokens_total', 'counter', 'Estimated evidence prompt tokens before/after the budget',
+                  lambda: [({'stage': 'before'}, _savings['tokens_before']), ({'stage': 'after'}, _savings['tokens_after'])])
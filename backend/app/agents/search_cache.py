@@ -0,0 +1,102 @@
+# Two-tier cache in front of the evidence search providers.
+# Tier 1 is an in-process LRU with per-entry TTL, tier 2 is a Mongo collection
+# with a TTL index so every replica shares the same hits.
+
+import datetime
+import hashlib
+import time
+from collections import OrderedDict, defaultdict
+from ..config import settings
+from ..db import search_cache
+from .. import metrics
+
+class LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+_local = LRUCache(settings.SEARCH_CACHE_SIZE)
+_stats = defaultdict(lambda: {'local_hits': 0, 'shared_hits': 0, 'misses': 0})
+
+def normalize_query(query):
+    # case and whitespace never change provider results; quotes and operators do
+    return ' '.join((query or '').lower().split())
+
+def cache_key(provider, query):
+    digest = hashlib.sha1(normalize_query(query).encode('utf-8')).hexdigest()
+    return f'{provider}:{digest}'
+
+def cache_stats():
+    return {'local_entries': len(_local), 'providers': {p: dict(s) for p, s in _stats.items()}}
+
+metrics.collector(
+    'misinfo_search_cache_lookups_total', 'counter', 'Search cache lookups by provider and tier',
+    lambda: [({'provider': p, 'result': r}, n) for p, s in list(_stats.items()) for r, n in s.items()]
+)
+metrics.collector('misinfo_search_cache_entries', 'gauge', 'Entries in the in-process search cache',
+                  lambda: [({}, len(_local))])
+
+async def cached_search(provider, query, search):
+    """
+    Returns search(query) for the given provider, served from cache when fresh.
+    Empty results are not cached so a transient provider error is retried.
+    """
+    ttl = settings.SEARCH_CACHE_TTL_SEC.get(provider, 0)
+    if ttl <= 0:
+        return await search(query)
+    key = cache_key(provider, query)
+    stats = _stats[provider]
+
+    hit = _local.get(key)
+    if hit is not None:
+        stats['local_hits'] += 1
+        return list(hit)
+
+    if settings.SEARCH_CACHE_SHARED:
+        now = datetime.datetime.utcnow()
+        try:
+            doc = await search_cache.find_one({'_id': key, 'expires_at': {'$gt': now}})
+        except Exception as e:
+            print(f"Search cache read error: {e}")
+            doc = None
+        if doc:
+            stats['shared_hits'] += 1
+            remaining = (doc['expires_at'] - now).total_seconds()
+            _local.set(key, doc['results'], remaining)
+            return list(doc['results'])
+
+    stats['misses'] += 1
+    results = await search(query)
+    if results:
+        _local.set(key, results, ttl)
+        if settings.SEARCH_CACHE_SHARED:
+            expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=ttl)
+            try:
+                await search_cache.update_one(
+                    {'_id': key},
+                    {'$set': {'provider': provider, 'results': results, 'expires_at': expires_at}},
+                    upsert=True
+                )
+            except Exception as e:
+                print(f"Search cache write error: {e}")
+    return list(results)
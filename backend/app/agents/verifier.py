@@ -1,16 +1,83 @@
 # Verifier combines multiple signal sources:
-# 1) Decompose claim into sub-questions (Decomposer Agent)
+# 1) Decompose complex claims into sub-questions (Decomposer Agent); simple
+#    claims are searched as-is and the raw claim is always searched up front
 # 2) Search for evidence for each sub-question (Search Agent)
 # 3) Use an LLM to assess the claim against evidence (Verifier Agent)
 
-import aiohttp
 import asyncio
+import datetime
 import json
-from ..db import claims, verifications
+import re
+from bson import ObjectId
+from pymongo import UpdateOne
+from ..db import claims, verifications, raw_items
 from ..config import settings
-from ..utils import now_iso
+from ..utils import now_iso, normalize_text
+from ..resilience import request_json, UpstreamError
+from ..coordination import claim_unverified, renew_claims, held_filter
+from ..events import bus
+from .. import metrics
+from .search_cache import cached_search
+from .dedup import fresh_verification
+from .rerank import rank_evidence, fit_to_budget
+from .local_index import search_local
+from .evidence_store import store_evidence, hydrate_evidence, normalize_link
+
+# --- Shared LLM plumbing ---
+class LLMError(Exception):
+    pass
+
+def _parse_json_content(content):
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return json.loads(content)
+
+async def chat_completion(system, prompt):
+    """
+    Sends one chat-completion request and returns the parsed JSON answer.
+    Raises LLMError when the request fails after retries or OpenAI is
+    circuit-broken.
+    """
+    headers = {
+        "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    data = {
+        "model": settings.LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.0
+    }
+    try:
+        result = await request_json('openai', 'POST', f"{settings.OPENAI_API_BASE}/chat/completions", json=data, headers=headers)
+    except UpstreamError as e:
+        raise LLMError(str(e))
+    return _parse_json_content(result['choices'][0]['message']['content'])
 
 # --- 1. Decomposer Agent ---
+# Clause and comparison markers that usually mean more than one fact to check
+_COMPOUND = re.compile(
+    r"\b(and|but|or|because|while|whereas|although|though|after|before|since|than|unless|despite|"
+    r"due to|which|so|then|versus|vs)\b|[;:,]",
+    re.IGNORECASE,
+)
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)?')
+
+def is_simple_claim(claim_text):
+    """
+    Local complexity check: short claims with a single clause and at most one
+    number are searched as-is, since the decomposer would only echo them back.
+    """
+    if settings.DECOMPOSE_MODE != 'auto':
+        return settings.DECOMPOSE_MODE == 'never'
+    if len(claim_text.split()) > settings.DECOMPOSE_SIMPLE_MAX_WORDS:
+        return False
+    return not _COMPOUND.search(claim_text) and len(_NUMBER.findall(claim_text)) <= 1
+
 async def decompose_claim(claim_text):
     """
     Breaks a complex claim into atomic sub-questions for targeted searching.
@@ -34,34 +101,11 @@ async def decompose_claim(claim_text):
     }}
     """
     
-    headers = {
-        "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    data = {
-        "model": "gpt-3.5-turbo",
-        "messages": [
-            {"role": "system", "content": "You are a research planner."},
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.0
-    }
-    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post("https://api.openai.com/v1/chat/completions", json=data, headers=headers) as resp:
-                if resp.status != 200:
-                    return [claim_text]
-                result = await resp.json()
-                content = result['choices'][0]['message']['content']
-                
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                parsed = json.loads(content)
-                return parsed.get('queries', [claim_text])
+        parsed = await chat_completion("You are a research planner.", prompt)
+        return parsed.get('queries', [claim_text])
+    except LLMError:
+        return [claim_text]
     except Exception as e:
         print(f"Decomposer Error: {e}")
         return [claim_text]
@@ -69,24 +113,28 @@ async def decompose_claim(claim_text):
 # --- 2. Search Agent ---
 async def search_web(query):
     # Use Google Custom Search JSON API if available
-    if settings.GOOGLE_CSE_API_KEY and settings.GOOGLE_CSE_ID:
-        url = 'https://www.googleapis.com/customsearch/v1'
-        params = {'key': settings.GOOGLE_CSE_API_KEY, 'cx': settings.GOOGLE_CSE_ID, 'q': query, 'num': 5}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as resp:
-                    data = await resp.json()
-            items = data.get('items', [])
-            results = [{'title': i.get('title'), 'snippet': i.get('snippet'), 'link': i.get('link'), 'source': i.get('displayLink')} for i in items]
-            return results
-        except Exception:
-            return []
-    return []
+    if not (settings.GOOGLE_CSE_API_KEY and settings.GOOGLE_CSE_ID):
+        return []
+    return await cached_search('web', query, _search_web)
+
+async def _search_web(query):
+    url = settings.GOOGLE_CSE_API_BASE
+    params = {'key': settings.GOOGLE_CSE_API_KEY, 'cx': settings.GOOGLE_CSE_ID, 'q': query, 'num': 5}
+    try:
+        data = await request_json('google', 'GET', url, params=params)
+        items = data.get('items', [])
+        results = [{'title': i.get('title'), 'snippet': i.get('snippet'), 'link': i.get('link'), 'source': i.get('displayLink')} for i in items]
+        return results
+    except Exception:
+        return []
 
 async def search_newsapi(query):
     if not settings.NEWSAPI_KEY:
         return []
-    url = 'https://newsapi.org/v2/everything'
+    return await cached_search('newsapi', query, _search_newsapi)
+
+async def _search_newsapi(query):
+    url = f'{settings.NEWSAPI_API_BASE}/everything'
     params = {
         'apiKey': settings.NEWSAPI_KEY,
         'q': query,
@@ -95,11 +143,7 @@ async def search_newsapi(query):
         'pageSize': 5
     }
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        data = await request_json('newsapi', 'GET', url, params=params)
         articles = data.get('articles', [])
         return [{
             'title': a.get('title'),
@@ -111,15 +155,14 @@ async def search_newsapi(query):
         return []
 
 async def search_reddit(query):
-    url = 'https://www.reddit.com/search.json'
+    return await cached_search('reddit', query, _search_reddit)
+
+async def _search_reddit(query):
+    url = f'{settings.REDDIT_API_BASE}/search.json'
     params = {'q': query, 'sort': 'relevance', 'limit': 5, 'type': 'link,self'}
     headers = {'User-Agent': 'MisinfoAgent/1.0'}
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        data = await request_json('reddit', 'GET', url, params=params, headers=headers)
         
         children = data.get('data', {}).get('children', [])
         results = []
@@ -136,17 +179,23 @@ async def search_reddit(query):
         return []
 
 # --- 3. Verifier Agent ---
-async def score_with_llm(claim_text, evidence):
-    if not settings.OPENAI_API_KEY:
-        return None, 0.0, []
-
-    # Prepare evidence text
+def format_evidence(evidence):
     evidence_text = ""
     for i, e in enumerate(evidence):
         source = e.get('source', 'Unknown')
         snippet = e.get('snippet', '')
         title = e.get('title', '')
         evidence_text += f"Source {i+1} ({source}): {title} - {snippet}\n"
+    return evidence_text
+
+def parse_verdict(parsed):
+    return parsed.get('verdict', 'UNVERIFIED').lower(), parsed.get('confidence', 0.5), [parsed.get('summary', '')]
+
+async def score_with_llm(claim_text, evidence):
+    if not settings.OPENAI_API_KEY:
+        return None, 0.0, []
+
+    evidence_text = format_evidence(evidence)
 
     prompt = f"""
     You are an expert fact-checker using a "Chain of Thought" reasoning process.
@@ -172,39 +221,18 @@ async def score_with_llm(claim_text, evidence):
     }}
     """
 
-    headers = {
-        "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    data = {
-        "model": "gpt-3.5-turbo", 
-        "messages": [
-            {"role": "system", "content": "You are a strict, logical fact-checker."},
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.0
-    }
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post("https://api.openai.com/v1/chat/completions", json=data, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"LLM Error: {await resp.text()}")
-                    return None, 0.0, []
-                result = await resp.json()
-                content = result['choices'][0]['message']['content']
-                
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                parsed = json.loads(content)
-                return parsed.get('verdict', 'UNVERIFIED').lower(), parsed.get('confidence', 0.5), [parsed.get('summary', '')]
+        parsed = await chat_completion("You are a strict, logical fact-checker.", prompt)
+        return parse_verdict(parsed)
+    except LLMError as e:
+        print(f"LLM Error: {e}")
+        return None, 0.0, []
     except Exception as e:
         print(f"LLM Exception: {e}")
         return None, 0.0, []
 
+SEARCH_PROVIDERS = [search_web, search_newsapi, search_reddit, search_local]
+
 def filter_evidence(evidence):
     """
     Filters out known fiction/satire sources for the final display.
@@ -219,39 +247,64 @@ def filter_evidence(evidence):
         filtered.append(e)
     return filtered
 
-async def verify_claim_text(text):
-    # 1. Decompose
-    queries = await decompose_claim(text)
-    print(f"Decomposed '{text}' into: {queries}")
-    
-    # 2. Search (Parallel execution for sub-questions)
+async def gather_evidence(text, exclude_links=()):
+    # 1. Search the claim itself right away. Simple claims stop there; for
+    # complex ones this runs speculatively while the decomposer is thinking.
+    with metrics.timed('evidence'):
+        speculative = asyncio.ensure_future(asyncio.gather(*[search(text) for search in SEARCH_PROVIDERS]))
+        # if we get cancelled mid-way, mark the outcome as seen so asyncio does not log it
+        speculative.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            if is_simple_claim(text):
+                metrics.decompositions.inc(path='skipped')
+                results = await speculative
+            else:
+                metrics.decompositions.inc(path='speculative')
+                # 2. Decompose
+                with metrics.timed('decompose'):
+                    queries = await decompose_claim(text)
+                print(f"Decomposed '{text}' into: {queries}")
+
+                # 3. Search every new sub-question x provider in parallel, merged with the speculative results
+                # Limit to top 2 queries to save API calls if needed, but 3 is fine
+                seen = {normalize_text(text)}
+                extra = []
+                for q in queries[:3]:
+                    if normalize_text(q) not in seen:
+                        seen.add(normalize_text(q))
+                        extra.append(q)
+                more = await asyncio.gather(*[search(q) for q in extra for search in SEARCH_PROVIDERS])
+                results = list(await speculative) + list(more)
+        finally:
+            speculative.cancel()
     all_evidence = []
-    
-    # Limit to top 2 queries to save API calls if needed, but 3 is fine
-    for q in queries[:3]:
-        # Run searches in parallel for this query
-        results = await asyncio.gather(
-            search_web(q),
-            search_newsapi(q),
-            search_reddit(q)
-        )
-        for r in results:
-            all_evidence.extend(r)
-            
-    # Deduplicate evidence by link
+    for r in results:
+        all_evidence.extend(r)
+
+    # Deduplicate evidence by link; the articles the claim was extracted from
+    # are not evidence for it
+    excluded = {normalize_link(link) for link in exclude_links}
     seen_links = set()
     unique_evidence = []
     for e in all_evidence:
+        if excluded and normalize_link(e['link']) in excluded:
+            continue
         if e['link'] not in seen_links:
             unique_evidence.append(e)
             seen_links.add(e['link'])
-    
-    # 3. Verify
-    # Try LLM first
-    llm_verdict, llm_score, llm_reasons = await score_with_llm(text, unique_evidence)
-    
-    filtered_evidence = filter_evidence(unique_evidence)
-    
+    return unique_evidence
+
+def prepare_evidence(text, evidence):
+    """
+    Drops fiction/satire sources, ranks the rest by relevance to the claim and
+    trims the prompt copy to the evidence token budget.
+    Returns (ranked evidence for display, evidence for the prompt).
+    """
+    with metrics.timed('rerank'):
+        ranked = rank_evidence(text, filter_evidence(evidence))
+        return ranked, fit_to_budget(ranked)
+
+def build_result(llm_verdict, llm_score, llm_reasons, filtered_evidence):
     if llm_verdict:
         return {
             'verdict': llm_verdict,
@@ -262,30 +315,233 @@ async def verify_claim_text(text):
         }
         
     # Fallback (Simple Heuristic if LLM fails)
-    # Re-using the logic from before but simplified as fallback
+    # Re-using the logic from before but simplified as fallback.
+    # llm_failed keeps it from being reused as a fresh verdict for duplicates.
     return {
         'verdict': 'unverified',
         'score': 0.0,
         'evidence': filtered_evidence,
         'reasons': ["LLM verification unavailable."],
-        'summary': "Could not verify claim due to system limitation."
+        'summary': "Could not verify claim due to system limitation.",
+        'llm_failed': True
     }
 
+async def verify_claim_text(text, exclude_links=()):
+    with metrics.trace(text), metrics.timed('verify'):
+        unique_evidence = await gather_evidence(text, exclude_links)
+        ranked, prompt_evidence = prepare_evidence(text, unique_evidence)
+
+        # 3. Verify
+        # Try LLM first
+        with metrics.timed('llm_score'):
+            llm_verdict, llm_score, llm_reasons = await score_with_llm(text, prompt_evidence)
+        return build_result(llm_verdict, llm_score, llm_reasons, ranked)
+
+# --- 3b. Batched Verifier Agent (scheduled runs) ---
+def _estimate_tokens(text):
+    # ~4 characters per token is close enough for packing requests
+    return len(text) // 4 + 1
+
+def pack_batches(blocks):
+    """
+    Greedily groups claim blocks into batches that fit LLM_BATCH_TOKEN_BUDGET
+    and LLM_BATCH_MAX_CLAIMS. Returns lists of indexes into `blocks`.
+    """
+    batches, current, used = [], [], 0
+    for i, block in enumerate(blocks):
+        cost = _estimate_tokens(block)
+        if current and (used + cost > settings.LLM_BATCH_TOKEN_BUDGET or len(current) >= settings.LLM_BATCH_MAX_CLAIMS):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+async def _score_batch(indexes, blocks):
+    """Scores one packed batch. Returns {index: (verdict, score, reasons)} for the items that parsed."""
+    prompt = f"""
+    You are an expert fact-checker. Assess each claim below independently, using only the evidence listed under it.
+    
+    {"".join(blocks[i] for i in indexes)}
+    Instructions:
+    1. Check for absurdity and scientific consensus; claims contradicting basic biological/physical facts are FALSE.
+    2. Disregard "evidence" from r/WritingPrompts, r/memes, or satire sites for factual claims.
+    3. For every claim give a verdict (TRUE, FALSE, MIXTURE, or UNVERIFIED), a confidence score (0.0-1.0) and a concise summary.
+    
+    Output format (JSON):
+    {{
+        "results": [
+            {{"id": <claim id>, "verdict": "TRUE" | "FALSE" | "MIXTURE" | "UNVERIFIED", "confidence": <float>, "summary": "<string>"}}
+        ]
+    }}
+    """
+    try:
+        parsed = await chat_completion("You are a strict, logical fact-checker.", prompt)
+    except Exception as e:
+        print(f"LLM Batch Error: {e}")
+        return {}
+    scored = {}
+    for r in parsed.get('results', []) if isinstance(parsed, dict) else []:
+        try:
+            i = int(r['id'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if i in indexes and isinstance(r.get('verdict'), str):
+            scored[i] = parse_verdict(r)
+    return scored
+
+async def score_batch_with_llm(items):
+    """
+    Scores many (claim_text, evidence) pairs with as few chat-completion
+    requests as the token budget allows. Items missing from a batch answer
+    fall back to score_with_llm. Returns results in input order.
+    """
+    if not settings.OPENAI_API_KEY:
+        return [(None, 0.0, []) for _ in items]
+
+    blocks = [f'Claim {i}: "{text}"\nEvidence for claim {i}:\n{format_evidence(evidence)}\n' for i, (text, evidence) in enumerate(items)]
+    batches = pack_batches(blocks)
+    answers = await asyncio.gather(*[_score_batch(b, blocks) for b in batches])
+    scored = {}
+    for a in answers:
+        scored.update(a)
+
+    missing = [i for i in range(len(items)) if i not in scored]
+    if missing:
+        print(f"LLM Batch: {len(missing)} of {len(items)} claim(s) fell back to single scoring")
+        singles = await asyncio.gather(*[score_with_llm(*items[i]) for i in missing])
+        scored.update(zip(missing, singles))
+    return [scored[i] for i in range(len(items))]
+
+# --- 4. Claim-level concurrency ---
+_slots = None
+
+def verify_slots():
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.VERIFY_CONCURRENCY)
+    return _slots
+
+async def verify_many(texts, exclude_links=None):
+    """
+    Verifies many claims concurrently, at most VERIFY_CONCURRENCY at a time
+    across all callers. Results come back in input order; a claim that fails
+    yields its exception instead of aborting the others. `exclude_links`
+    optionally gives, per claim, links never to use as its evidence.
+    """
+    exclude_links = exclude_links or [()] * len(texts)
+    async def _one(text, exclude):
+        async with verify_slots():
+            return await verify_claim_text(text, exclude)
+    return await asyncio.gather(*[_one(t, x) for t, x in zip(texts, exclude_links)], return_exceptions=True)
+
+async def verify_many_batched(texts, exclude_links=None):
+    """
+    Same contract as verify_many, but evidence is gathered per claim and the
+    LLM verdicts are scored in packed batches.
+    """
+    exclude_links = exclude_links or [()] * len(texts)
+    async def _gather(text, exclude):
+        async with verify_slots():
+            with metrics.trace(text):
+                return await gather_evidence(text, exclude)
+    evidence = await asyncio.gather(*[_gather(t, x) for t, x in zip(texts, exclude_links)], return_exceptions=True)
+    ok = [i for i, e in enumerate(evidence) if not isinstance(e, Exception)]
+    prepared = {i: prepare_evidence(texts[i], evidence[i]) for i in ok}
+    with metrics.timed('llm_batch'):
+        scores = await score_batch_with_llm([(texts[i], prepared[i][1]) for i in ok])
+    results = list(evidence)
+    for i, (verdict, score, reasons) in zip(ok, scores):
+        results[i] = build_result(verdict, score, reasons, prepared[i][0])
+    return results
+
 async def run_verifier(limit=50):
-    cursor = claims.find({'status': 'unverified'}).limit(limit)
+    # claimed first, so concurrent runs on other replicas never pick the same claims
+    pending = await claim_unverified(limit)
+    return await verify_claims(pending)
+
+async def _source_links(docs):
+    """raw_id -> URL of the raw item each claim was extracted from, in one query."""
+    ids = list({ObjectId(c['raw_id']) for c in docs if ObjectId.is_valid(c.get('raw_id') or '')})
+    if not ids:
+        return {}
+    return {str(r['_id']): r.get('url') async for r in raw_items.find({'_id': {'$in': ids}}, {'url': 1})}
+
+async def verify_claims(pending):
+    """
+    Verifies a list of claimed claim documents and writes their verifications
+    and statuses in bulk. Claims this worker no longer holds are skipped;
+    claims whose LLM call failed are retried with backoff until
+    VERIFY_MAX_ATTEMPTS. Returns the verification docs that were written.
+    """
+    # Group near-duplicates under their canonical claim so each group costs at
+    # most one verification, and none when a fresh one already exists.
+    groups = {}
+    for c in pending:
+        groups.setdefault(c.get('canonical_id') or str(c['_id']), []).append(c)
+    canonical_ids = list(groups)
+    fresh = await asyncio.gather(*[fresh_verification(cid) for cid in canonical_ids])
+    reused = {cid: ver for cid, ver in zip(canonical_ids, fresh) if ver}
+    to_verify = [cid for cid in canonical_ids if cid not in reused]
+    verify = verify_many_batched if settings.LLM_BATCH_SCORING else verify_many
+    # a claim's own source articles would be circular evidence for its group
+    urls = await _source_links([c for cid in to_verify for c in groups[cid]])
+    sources = [{urls[c['raw_id']] for c in groups[cid] if urls.get(c.get('raw_id'))} for cid in to_verify]
+    results = await verify([groups[cid][0]['text'] for cid in to_verify], sources)
+    # renewing the claims right before writing keeps them ours for the writes below
+    held = {c['_id'] for c in await renew_claims(pending)}
+
     updated = []
-    async for c in cursor:
-        text = c['text']
-        result = await verify_claim_text(text)
-        
-        ver = {
-            'claim_id': str(c['_id']),
-            'verdict': result['verdict'],
-            'score': result['score'],
-            'evidence': result['evidence'],
-            'checked_at': now_iso()
-        }
-        await verifications.insert_one(ver)
-        await claims.update_one({'_id': c['_id']}, {'$set': {'status': result['verdict']}})
-        updated.append(ver)
+    status_updates = []
+    for cid, result in list(zip(to_verify, results)) + [(cid, None) for cid in reused]:
+        if isinstance(result, Exception):
+            print(f"Verifier Error for claim {cid}: {result}")
+            continue
+        # evidence is stored once per link; verifications keep refs + relevance
+        if result is None:
+            original = reused[cid]
+            refs = original.get('evidence_refs')
+            if refs is None:
+                refs = await store_evidence(original.get('evidence') or [])
+        else:
+            refs = await store_evidence(result['evidence'])
+        for c in groups[cid]:
+            if c['_id'] not in held:
+                continue
+            attempts = c.get('verify_attempts', 0) + 1
+            if result is not None and result.get('llm_failed') and attempts < settings.VERIFY_MAX_ATTEMPTS:
+                # keep it pending, but nobody claims it again before the backoff ends
+                retry_at = datetime.datetime.utcnow() + datetime.timedelta(
+                    seconds=settings.VERIFY_RETRY_BASE_SEC * 2 ** (attempts - 1))
+                status_updates.append(UpdateOne(held_filter([c]), {
+                    '$set': {'status': 'unverified', 'verify_attempts': attempts, 'claimed_until': retry_at}}))
+                continue
+            ver = {
+                'claim_id': str(c['_id']),
+                'canonical_id': cid,
+                'checked_at': now_iso()
+            }
+            if result is None:
+                ver.update({k: original.get(k) for k in ('verdict', 'score', 'summary', 'reasons')})
+                ver['reused_from'] = str(original['_id'])
+            else:
+                ver.update({k: result[k] for k in ('verdict', 'score', 'summary', 'reasons')})
+                if result.get('llm_failed'):
+                    ver['llm_failed'] = True
+            ver['evidence_refs'] = refs
+            updated.append(ver)
+            status_updates.append(UpdateOne(held_filter([c]), {'$set': {
+                'status': ver['verdict'], 'verified_at': ver['checked_at'], 'verify_attempts': attempts}}))
+    if status_updates:
+        if updated:
+            await verifications.insert_many(updated, ordered=False)
+        await claims.bulk_write(status_updates, ordered=False)
+    if updated:
+        updated = await hydrate_evidence([dict(v) for v in updated])
+        metrics.items_processed.inc(sum(1 for v in updated if 'reused_from' not in v), kind='verification')
+        metrics.items_processed.inc(sum(1 for v in updated if 'reused_from' in v), kind='verification_reused')
+        bus.emit('verification', updated)
+        bus.emit('claim_status', [{'_id': v['claim_id'], 'status': v['verdict']} for v in updated])
     return updated
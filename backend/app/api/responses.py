@@ -0,0 +1,70 @@
+# Fast response path for the API.
+# Documents are serialized straight from Mongo with orjson (ObjectId and
+# datetime handled by the encoder, no per-document fix-up pass). List pages
+# carry an ETag so an unchanged poll is answered with 304 and no body, and
+# larger bodies are compressed with brotli or gzip when the client accepts it.
+
+import gzip
+import hashlib
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
+from ..config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def _default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+def dumps(content):
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+class JSONResponse(ORJSONResponse):
+    """Default response class: orjson with ObjectId support."""
+
+    def render(self, content):
+        return dumps(content)
+
+def _etag(body):
+    # weak: the same validator covers the gzip, brotli and identity encodings
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def _not_modified(if_none_match, etag):
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(',')]
+    return '*' in tags or etag in tags or etag[2:] in tags
+
+def _encoding(accept_encoding):
+    accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+def conditional_json(request, content, headers=None):
+    """
+    Serializes content once and returns 304 when it matches the client's
+    If-None-Match, otherwise a (possibly compressed) JSON response with an ETag.
+    """
+    body = dumps(content)
+    etag = _etag(body)
+    headers = dict(headers or {}, ETag=etag, **{'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'})
+    if _not_modified(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = _encoding(request.headers.get('accept-encoding', '')) if settings.RESPONSE_COMPRESSION else None
+    if encoding and len(body) >= settings.RESPONSE_COMPRESS_MIN_BYTES:
+        if encoding == 'br':
+            body = brotli.compress(body, quality=settings.RESPONSE_BROTLI_QUALITY)
+        else:
+            body = gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL)
+        headers['Content-Encoding'] = encoding
+    return Response(body, media_type='application/json', headers=headers)
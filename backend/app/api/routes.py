@@ -1,40 +1,118 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from ..db import raw_items, claims, verifications
-from ..utils import now_iso
-from ..agents.verifier import verify_claim_text
-from .schemas import VerifyRequest
+from ..utils import now_iso, article_text
+from ..config import settings
+from ..events import bus
+from ..agents.search_cache import cache_stats
+from ..agents.rerank import savings_stats
+from ..agents.evidence_store import hydrate_evidence
+from ..resilience import provider_states
+from ..jobs import verify_text, verify_stream, job_pool, QueueFull
+from .schemas import VerifyRequest, VerifyBatchRequest
+from .responses import conditional_json, dumps
 from bson import ObjectId
-from typing import List
+import asyncio
+from typing import List, Optional
 
 router = APIRouter()
 
 @router.get('/health')
 async def health():
-    return {'status': 'ok'}
+    return {'status': 'ok', 'providers': provider_states()}
+
+@router.get('/search-cache/stats')
+async def search_cache_stats():
+    return cache_stats()
+
+# --- List endpoints ---
+# Keyset pagination: results are ordered by (sort key, _id) descending and the
+# X-Next-Cursor header carries "<sort key>,<_id>" of the last row; pass it back
+# as ?after= to get the next page. view=summary drops the heavy fields.
+MAX_PAGE_SIZE = 200
+
+SUMMARY_PROJECTIONS = {
+    'items': {'body_z': 0, 'meta.full_text': 0, 'claim_token': 0, 'claimed_by': 0, 'claimed_until': 0},
+    'claims': {'simhash': 0, 'simhash_bands': 0, 'claim_token': 0, 'claimed_by': 0, 'claimed_until': 0, 'verify_attempts': 0},
+    'verifications': {'evidence': {'$slice': 3}, 'evidence_refs': {'$slice': 3}, 'reasons': 0},
+}
+
+def _after_filter(sort_key, after):
+    try:
+        value, last_id = after.rsplit(',', 1)
+        last_id = ObjectId(last_id)
+    except Exception:
+        raise HTTPException(400, 'Invalid cursor')
+    return {'$or': [
+        {sort_key: {'$lt': value}},
+        {sort_key: value, '_id': {'$lt': last_id}},
+    ]}
+
+async def list_page(request, collection, name, sort_key, query=None, limit=50, after=None, view='full', hydrate=None):
+    if view not in ('full', 'summary'):
+        raise HTTPException(400, "view must be 'full' or 'summary'")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    conditions = [query] if query else []
+    if after:
+        conditions.append(_after_filter(sort_key, after))
+    filt = {'$and': conditions} if len(conditions) > 1 else (conditions[0] if conditions else {})
+    projection = SUMMARY_PROJECTIONS[name] if view == 'summary' else None
+    cursor = collection.find(filt, projection).sort([(sort_key, -1), ('_id', -1)]).limit(limit)
+    result = await cursor.to_list(length=limit)
+    if hydrate:
+        await hydrate(result)
+    headers = {}
+    if len(result) == limit and result[-1].get(sort_key):
+        headers['X-Next-Cursor'] = f"{result[-1][sort_key]},{result[-1]['_id']}"
+    return conditional_json(request, result, headers)
+
+@router.get('/evidence/stats')
+async def evidence_stats():
+    return savings_stats()
+
+async def expand_article_text(docs):
+    # view=full keeps returning the article as meta.full_text
+    for d in docs:
+        if 'body_z' in d:
+            d.setdefault('meta', {})['full_text'] = article_text(d)
+            del d['body_z']
 
 @router.get('/items')
-async def get_items(limit: int = 50):
-    cursor = raw_items.find().sort('fetched_at', -1).limit(limit)
-    items = [item async for item in cursor]
-    for i in items:
-        i['_id'] = str(i['_id'])
-    return items
+async def get_items(request: Request, limit: int = 50, after: Optional[str] = None, view: str = 'full'):
+    return await list_page(request, raw_items, 'items', 'fetched_at', limit=limit, after=after, view=view, hydrate=expand_article_text)
 
 @router.get('/claims')
-async def get_claims(limit: int = 50):
-    cursor = claims.find().sort('extracted_at', -1).limit(limit)
-    result = [c async for c in cursor]
-    for c in result:
-        c['_id'] = str(c['_id'])
-    return result
+async def get_claims(request: Request, limit: int = 50, after: Optional[str] = None, view: str = 'full', status: Optional[str] = None):
+    query = {'status': status} if status else None
+    return await list_page(request, claims, 'claims', 'extracted_at', query, limit, after, view)
 
 @router.get('/verifications')
-async def get_verifications(limit: int = 50):
-    cursor = verifications.find().sort('checked_at', -1).limit(limit)
-    result = [v async for v in cursor]
-    for v in result:
-        v['_id'] = str(v['_id'])
-    return result
+async def get_verifications(request: Request, limit: int = 50, after: Optional[str] = None, view: str = 'full', verdict: Optional[str] = None):
+    query = {'verdict': verdict} if verdict else None
+    return await list_page(request, verifications, 'verifications', 'checked_at', query, limit, after, view, hydrate_evidence)
+
+@router.get('/stream')
+async def stream_updates(request: Request):
+    """
+    Server-Sent Events feed of new raw items, claims, claim status changes and
+    verifications, so dashboards do not need to poll the list endpoints.
+    """
+    queue = bus.subscribe()
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f"event: {event['type']}\ndata: {dumps(event['data']).decode()}\n\n"
+        finally:
+            bus.unsubscribe(queue)
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return StreamingResponse(events(), media_type='text/event-stream', headers=headers)
 
 @router.post('/verify/{claim_id}')
 async def manual_verify(claim_id: str):
@@ -48,6 +126,47 @@ async def manual_verify(claim_id: str):
     return {'ok': True}
 
 @router.post('/verify-text')
-async def verify_text_endpoint(req: VerifyRequest):
-    result = await verify_claim_text(req.text)
-    return result
+async def verify_text_endpoint(req: VerifyRequest, response: Response, mode: str = 'sync'):
+    """
+    mode=sync (default) returns the verdict. Identical texts submitted at the
+    same time share one verification run.
+    mode=async returns a job id right away; poll GET /jobs/{job_id}.
+    """
+    if mode == 'async':
+        try:
+            job_id = await job_pool.submit(req.text)
+        except QueueFull:
+            raise HTTPException(503, 'Verification queue is full, retry later')
+        response.status_code = 202
+        return {'job_id': job_id, 'status': 'queued'}
+    if mode != 'sync':
+        raise HTTPException(400, "mode must be 'sync' or 'async'")
+    return await verify_text(req.text)
+
+@router.post('/verify-batch')
+async def verify_batch_endpoint(req: VerifyBatchRequest):
+    """
+    Verifies many claims concurrently and streams one JSON object per line
+    (application/x-ndjson) as each claim finishes, in completion order. Each
+    line carries the claim's index in the request.
+    """
+    if len(req.claims) > settings.VERIFY_BATCH_MAX_CLAIMS:
+        raise HTTPException(413, f'At most {settings.VERIFY_BATCH_MAX_CLAIMS} claims per batch')
+
+    async def lines():
+        async for i, result in verify_stream(req.claims):
+            if isinstance(result, Exception):
+                line = {'index': i, 'text': req.claims[i], 'error': str(result)}
+            else:
+                line = {'index': i, 'text': req.claims[i], **result}
+            yield dumps(line) + b'\n'
+
+    return StreamingResponse(lines(), media_type='application/x-ndjson')
+
+@router.get('/jobs/{job_id}')
+async def get_job(job_id: str, wait: float = 0.0):
+    """Job status and result. wait=N long-polls up to N seconds for the job to finish."""
+    job = await job_pool.get(job_id, min(max(wait, 0.0), settings.JOB_MAX_WAIT_SEC))
+    if not job:
+        raise HTTPException(404, 'Job not found')
+    return job
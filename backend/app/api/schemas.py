@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 class RawItem(BaseModel):
     source: str
@@ -13,13 +13,21 @@ class Claim(BaseModel):
     text: str
     extracted_at: Optional[str]
     status: Optional[str] = 'unverified'
+    canonical_id: Optional[str]
 
 class Verification(BaseModel):
     claim_id: str
     verdict: str  # 'true','false','mixture','unverified'
     score: float
     evidence: Optional[list] = []
+    summary: Optional[str]
+    reasons: Optional[list] = []
+    canonical_id: Optional[str]
+    reused_from: Optional[str]
     checked_at: Optional[str]
 
 class VerifyRequest(BaseModel):
     text: str
+
+class VerifyBatchRequest(BaseModel):
+    claims: List[str]
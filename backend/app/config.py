@@ -1,3 +1,4 @@
+from typing import Dict
 from pydantic import BaseSettings
 
 class Settings(BaseSettings):
@@ -11,6 +12,127 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "devsecret"
     PORT: int = 8000
 
+    # Shared HTTP client
+    HTTP_POOL_SIZE: int = 100
+    HTTP_POOL_PER_HOST: int = 10
+    HTTP_DNS_CACHE_TTL_SEC: int = 300
+    HTTP_KEEPALIVE_SEC: float = 30.0
+    HTTP_TIMEOUT_SEC: float = 30.0
+    HTTP_CONNECT_TIMEOUT_SEC: float = 5.0
+    SCRAPE_TIMEOUT_SEC: float = 15.0
+    # article pages: bytes read per page, parser pool ('process' or 'thread', 0 workers = auto)
+    SCRAPE_MAX_BYTES: int = 2 * 1024 * 1024
+    SCRAPE_PARSE_POOL: str = 'process'
+    SCRAPE_PARSE_WORKERS: int = 0
+    # scraped article text kept per item (characters, before compression)
+    ARTICLE_TEXT_MAX_CHARS: int = 20000
+    ARTICLE_TEXT_COMPRESS_LEVEL: int = 6
+
+    # Streaming pipeline
+    PIPELINE_QUEUE_SIZE: int = 500
+    PIPELINE_EXTRACT_WORKERS: int = 2
+    PIPELINE_VERIFY_WORKERS: int = 4
+    PIPELINE_DRAIN_TIMEOUT_SEC: float = 30.0
+    # every worker claims backlog this often; only the lease holder fetches news
+    PIPELINE_SWEEP_SEC: float = 60.0
+    # false on API replicas when agents run in separate `python -m app.worker` processes
+    RUN_AGENTS_IN_API: bool = True
+
+    # Replica coordination (MongoDB leases and work claims)
+    LEASE_TTL_SEC: float = 30.0
+    LEASE_RENEW_SEC: float = 10.0
+    WORK_CLAIM_TTL_SEC: float = 900.0
+
+    # Live updates (/api/stream)
+    EVENTS_SUBSCRIBER_BUFFER: int = 200
+    EVENTS_HEARTBEAT_SEC: float = 15.0
+    # source deltas from MongoDB change streams (needs a replica set)
+    EVENTS_CHANGE_STREAMS: bool = False
+
+    # Upstream providers: requests/sec per provider, retries, circuit breaker
+    PROVIDER_RATE_LIMITS: Dict[str, float] = {'openai': 5.0, 'newsapi': 2.0, 'google': 5.0, 'reddit': 1.0}
+    PROVIDER_DEFAULT_RATE: float = 5.0
+    PROVIDER_BURST_SEC: float = 2.0
+    RATE_LIMIT_MAX_WAIT_SEC: float = 5.0
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_BASE_DELAY_SEC: float = 0.5
+    RETRY_MAX_DELAY_SEC: float = 8.0
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_COOLDOWN_SEC: float = 60.0
+
+    # Fetcher
+    FETCH_CONCURRENCY: int = 10
+    FETCH_PER_HOST_CONCURRENCY: int = 2
+    FETCH_DEADLINE_SEC: float = 45.0
+
+    # Verifier
+    VERIFY_CONCURRENCY: int = 8
+    # a claim whose LLM call failed is retried after VERIFY_RETRY_BASE_SEC * 2**n,
+    # and gets the 'unverified' fallback once it has failed this many times
+    VERIFY_MAX_ATTEMPTS: int = 3
+    VERIFY_RETRY_BASE_SEC: float = 300.0
+    OPENAI_API_BASE: str = 'https://api.openai.com/v1'
+    # 'auto' skips the decomposer for short single-clause claims; 'always' / 'never'
+    DECOMPOSE_MODE: str = 'auto'
+    DECOMPOSE_SIMPLE_MAX_WORDS: int = 15
+    NEWSAPI_API_BASE: str = 'https://newsapi.org/v2'
+    GOOGLE_CSE_API_BASE: str = 'https://www.googleapis.com/customsearch/v1'
+    REDDIT_API_BASE: str = 'https://www.reddit.com'
+    LLM_MODEL: str = 'gpt-3.5-turbo'
+    # scheduled runs pack several claims into one scoring request
+    LLM_BATCH_SCORING: bool = True
+    LLM_BATCH_MAX_CLAIMS: int = 8
+    LLM_BATCH_TOKEN_BUDGET: int = 6000
+    # evidence sent to the LLM per claim, after relevance ranking
+    LLM_EVIDENCE_TOKEN_BUDGET: int = 1200
+    LLM_EVIDENCE_SNIPPET_CHARS: int = 500
+
+    # Claim extraction: 'heuristic', 'linear' (numpy classifier from
+    # train_claim_classifier.py) or 'model' (transformers, needs requirements-ml.txt)
+    CLAIM_EXTRACTOR: str = 'heuristic'
+    CLAIM_MODEL: str = 'facebook/bart-large-mnli'
+    CLAIM_MODEL_THRESHOLD: float = 0.6
+    CLAIM_LINEAR_MODEL: str = 'data/claim_linear.npz'
+    CLAIM_LINEAR_THRESHOLD: float = 0.5
+    EXTRACT_BATCH_SIZE: int = 100
+    # batches with this much text are split across EXTRACT_WORKERS processes (0 = auto)
+    EXTRACT_POOL_MIN_CHARS: int = 500_000
+    EXTRACT_WORKERS: int = 0
+
+    # /verify-text async jobs
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_SIZE: int = 200
+    JOB_TTL_SEC: int = 24 * 3600
+    JOB_POLL_INTERVAL_SEC: float = 0.5
+    JOB_MAX_WAIT_SEC: float = 30.0
+    VERIFY_BATCH_MAX_CLAIMS: int = 1000
+
+    # Local full-text search over ingested articles
+    LOCAL_INDEX_ENABLED: bool = True
+    LOCAL_INDEX_PATH: str = 'data/search_index.pkl'
+    LOCAL_INDEX_RESULTS: int = 5
+    LOCAL_INDEX_RELOAD_SEC: float = 60.0
+
+    # Near-duplicate claims
+    DEDUP_MAX_HAMMING: int = 3
+    DEDUP_MAX_CANDIDATES: int = 50
+    DEDUP_FRESHNESS_HOURS: int = 24
+
+    # Search cache (seconds of freshness per provider, 0 disables caching)
+    SEARCH_CACHE_SIZE: int = 2048
+    SEARCH_CACHE_SHARED: bool = True
+    SEARCH_CACHE_TTL_SEC: Dict[str, int] = {'web': 6 * 3600, 'newsapi': 1800, 'reddit': 900}
+
+    # API responses: compress JSON bodies at least this large (brotli needs the brotli package)
+    RESPONSE_COMPRESSION: bool = True
+    RESPONSE_COMPRESS_MIN_BYTES: int = 1024
+    RESPONSE_GZIP_LEVEL: int = 5
+    RESPONSE_BROTLI_QUALITY: int = 4
+
+    # Observability: GET /metrics (Prometheus text format), per-claim span logs
+    METRICS_MONGO_COMMANDS: bool = True
+    TRACE_CLAIMS: bool = False
+
     class Config:
         env_file = "../.env"
 
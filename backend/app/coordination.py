@@ -0,0 +1,161 @@
+# Coordination between replicas through MongoDB.
+# A leader lease makes singleton jobs (the news fetch) run on exactly one
+# process, and work claiming hands every raw item / claim to exactly one
+# worker: documents are tagged with the claiming worker and a deadline in one
+# conditional update, and a claim whose deadline passed (crashed worker) can be
+# taken again by anyone. Deadlines are extended when a worker starts on a
+# document and right before it writes results, and every write is conditional
+# on the claim token, so a document re-claimed elsewhere is never written twice.
+
+import asyncio
+import datetime
+import os
+import socket
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from .config import settings
+from .db import leases, raw_items, claims
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+def _now():
+    return datetime.datetime.utcnow()
+
+# --- Leader lease ---
+class LeaderLease:
+    """
+    Holds the named lease while the process is alive. `is_leader` is only
+    true while the last renewal succeeded, so a process that loses MongoDB
+    stops acting as leader before anyone else can take over.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.is_leader = False
+        self._task = None
+
+    async def try_acquire(self):
+        now = _now()
+        try:
+            await leases.find_one_and_update(
+                {'_id': self.name, '$or': [{'holder': WORKER_ID}, {'expires_at': {'$lt': now}}]},
+                {'$set': {'holder': WORKER_ID, 'expires_at': now + datetime.timedelta(seconds=settings.LEASE_TTL_SEC)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            acquired = True
+        except DuplicateKeyError:
+            # another process holds a live lease, so the upsert collided with its doc
+            acquired = False
+        except Exception as e:
+            print(f"Lease '{self.name}' renewal error: {e}")
+            acquired = False
+        if acquired != self.is_leader:
+            print(f"Lease '{self.name}': {WORKER_ID} {'acquired' if acquired else 'lost'} leadership")
+        self.is_leader = acquired
+        return acquired
+
+    async def _renew(self):
+        while True:
+            await self.try_acquire()
+            await asyncio.sleep(settings.LEASE_RENEW_SEC)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._renew())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.is_leader:
+            # hand over right away instead of making the next leader wait out the TTL
+            self.is_leader = False
+            await leases.update_one({'_id': self.name, 'holder': WORKER_ID}, {'$set': {'expires_at': _now()}})
+
+# --- Work claiming ---
+def _claimable(query):
+    return {'$and': [query, {'$or': [{'claimed_until': None}, {'claimed_until': {'$lt': _now()}}]}]}
+
+async def claim_work(collection, query, limit, ids=None, set_fields=None):
+    """
+    Claims up to `limit` documents matching `query` (optionally restricted to
+    `ids`) that no live worker holds, oldest first, and returns them.
+    """
+    if limit <= 0:
+        return []
+    filt = _claimable(query)
+    if ids is not None:
+        filt['$and'].append({'_id': {'$in': list(ids)}})
+    candidates = [d['_id'] async for d in collection.find(filt, {'_id': 1}).sort('_id', 1).limit(limit)]
+    if not candidates:
+        return []
+    token = ObjectId()
+    filt['$and'].append({'_id': {'$in': candidates}})
+    # the filter is re-checked per document, so a doc another worker claimed
+    # in the meantime is skipped
+    await collection.update_many(filt, {'$set': {
+        'claimed_by': WORKER_ID,
+        'claim_token': token,
+        'claimed_until': _now() + datetime.timedelta(seconds=settings.WORK_CLAIM_TTL_SEC),
+        **(set_fields or {}),
+    }})
+    return await collection.find({'_id': {'$in': candidates}, 'claim_token': token}).sort('_id', 1).to_list(length=limit)
+
+def held_filter(docs):
+    """Matches the docs whose claim (by this worker, with the token they were claimed with) is still current."""
+    return {'claimed_by': WORKER_ID, '$or': [{'_id': d['_id'], 'claim_token': d.get('claim_token')} for d in docs]}
+
+async def renew_work(collection, docs):
+    """
+    Restarts the claim deadline of the docs this worker still holds and
+    returns them; docs another worker has claimed since are left out.
+    """
+    if not docs:
+        return []
+    filt = held_filter(docs)
+    await collection.update_many(filt, {'$set': {
+        'claimed_until': _now() + datetime.timedelta(seconds=settings.WORK_CLAIM_TTL_SEC),
+    }})
+    held = {d['_id'] async for d in collection.find(filt, {'_id': 1})}
+    if len(held) < len(docs):
+        print(f"Work claim lost for {len(docs) - len(held)} {collection.name} doc(s), skipping them")
+    return [d for d in docs if d['_id'] in held]
+
+async def release_work(collection, ids, query, set_fields=None):
+    """
+    Gives claimed documents that still match `query` (not finished yet) back
+    so another worker can take them now.
+    """
+    if not ids:
+        return
+    await collection.update_many(
+        {'$and': [query, {'_id': {'$in': list(ids)}, 'claimed_by': WORKER_ID}]},
+        {'$set': {'claimed_until': None, **(set_fields or {})}},
+    )
+
+# --- Pipeline work ---
+# the verdict can itself be 'unverified', so a claim is pending only until
+# verify_claims stamps verified_at
+VERIFY_PENDING = {'status': {'$in': ['unverified', 'verifying']}, 'verified_at': None}
+
+async def claim_raw_items(limit, ids=None):
+    return await claim_work(raw_items, {'extracted': False}, limit, ids)
+
+async def claim_unverified(limit, ids=None):
+    # 'verifying' marks the claim as taken in the API too; expired ones are retried
+    return await claim_work(claims, VERIFY_PENDING, limit, ids, {'status': 'verifying'})
+
+async def renew_raw_items(items):
+    return await renew_work(raw_items, items)
+
+async def renew_claims(docs):
+    return await renew_work(claims, docs)
+
+async def release_raw_items(ids):
+    await release_work(raw_items, ids, {'extracted': False})
+
+async def release_claims(ids):
+    await release_work(claims, ids, VERIFY_PENDING, {'status': 'unverified'})
@@ -0,0 +1,54 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor
+
+# Named executors for CPU-bound work (HTML parsing, claim extraction).
+# Pools start on first use. Process pools use the spawn start method, because
+# forking a process that runs an event loop and driver threads is unsafe. A pool
+# whose worker died is replaced with a fresh one instead of failing every later
+# call until the process restarts.
+
+_pools = {}
+
+def pool_size(configured):
+    """Configured worker count, or min(4, CPUs) when it is 0."""
+    return configured or min(4, os.cpu_count() or 1)
+
+def get_pool(name, kind, workers):
+    pool = _pools.get(name)
+    if pool is None:
+        if kind == 'process':
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            pool = ThreadPoolExecutor(workers, thread_name_prefix=name)
+        _pools[name] = pool
+    return pool
+
+def _discard(name, pool):
+    # only drop the pool that broke; a concurrent call may already have replaced it
+    current = _pools.get(name) is pool
+    if current:
+        del _pools[name]
+        pool.shutdown(wait=False, cancel_futures=True)
+    return current
+
+async def run_in_pool(name, kind, workers, fn, *args):
+    """
+    Runs fn(*args) in the named pool. If the pool is broken (a worker was
+    killed), it is replaced and the call is retried once.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_pool(name, kind, workers)
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenExecutor:
+            if _discard(name, pool):
+                print(f"Worker pool '{name}' broke, starting a new one")
+            if attempt:
+                raise
+
+def close_pools():
+    for name, pool in list(_pools.items()):
+        _discard(name, pool)
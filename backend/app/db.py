@@ -1,15 +1,32 @@
 import motor.motor_asyncio
 from .config import settings
+from .metrics import MongoCommandListener
 
-client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGO_URI)
+listeners = [MongoCommandListener()] if settings.METRICS_MONGO_COMMANDS and MongoCommandListener else []
+client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGO_URI, event_listeners=listeners)
 db = client.get_default_database()
 
 # Collections
 raw_items = db['raw_items']
 claims = db['claims']
 verifications = db['verifications']
+search_cache = db['search_cache']
+jobs = db['jobs']
+leases = db['leases']
+evidence = db['evidence']
 
 async def init_indexes():
-    await raw_items.create_index('fetched_at')
-    await claims.create_index('status')
+    # list endpoints sort by (time, _id) descending for keyset pagination
+    await raw_items.create_index([('fetched_at', -1), ('_id', -1)])
+    await raw_items.create_index([('extracted', 1), ('_id', 1)])
+    await claims.create_index([('extracted_at', -1), ('_id', -1)])
+    await claims.create_index([('status', 1), ('extracted_at', -1), ('_id', -1)])
+    # work claiming scans pending docs oldest first
+    await claims.create_index([('status', 1), ('_id', 1)])
     await verifications.create_index('claim_id')
+    await verifications.create_index([('checked_at', -1), ('_id', -1)])
+    await verifications.create_index([('verdict', 1), ('checked_at', -1), ('_id', -1)])
+    await claims.create_index('simhash_bands')
+    await verifications.create_index([('canonical_id', 1), ('checked_at', -1)])
+    await search_cache.create_index('expires_at', expireAfterSeconds=0)
+    await jobs.create_index('created_at', expireAfterSeconds=settings.JOB_TTL_SEC)
@@ -0,0 +1,81 @@
+# In-process publish/subscribe for live dashboard updates.
+# The agents emit deltas (new raw items, claims, verifications, claim status
+# changes) as they write them; every open /api/stream connection gets its own
+# bounded queue. A slow viewer drops its oldest events instead of slowing the
+# pipeline. With EVENTS_CHANGE_STREAMS enabled the deltas come from MongoDB
+# change streams instead, so API replicas also see writes made by other
+# processes.
+
+import asyncio
+from .config import settings
+from .db import db
+from .agents.evidence_store import hydrate_evidence
+
+# collection name -> event type
+COLLECTION_EVENTS = {'raw_items': 'raw_item', 'claims': 'claim', 'verifications': 'verification'}
+
+def summary_view(kind, doc):
+    """Trims a document to what the dashboard renders (same shape as view=summary)."""
+    doc = dict(doc)
+    doc['_id'] = str(doc['_id'])
+    if kind == 'raw_item':
+        doc.pop('body_z', None)
+        if doc.get('meta'):
+            doc['meta'] = {k: v for k, v in doc['meta'].items() if k != 'full_text'}
+    elif kind == 'claim':
+        doc.pop('simhash', None)
+        doc.pop('simhash_bands', None)
+    elif kind == 'verification':
+        doc['evidence'] = (doc.get('evidence') or [])[:3]
+        doc.pop('reasons', None)
+    return doc
+
+class EventBus:
+    def __init__(self):
+        self._subscribers = set()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=settings.EVENTS_SUBSCRIBER_BUFFER)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, kind, doc):
+        event = {'type': kind, 'data': doc}
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def emit(self, kind, docs):
+        """Called by the agents after a write. No-op when change streams are the source."""
+        if settings.EVENTS_CHANGE_STREAMS or not self._subscribers:
+            return
+        for doc in docs:
+            self.publish(kind, doc if kind == 'claim_status' else summary_view(kind, doc))
+
+bus = EventBus()
+
+async def watch_changes():
+    """Publishes inserts (and claim updates) from MongoDB change streams. Needs a replica set."""
+    match = {'$match': {'$or': [
+        {'operationType': 'insert', 'ns.coll': {'$in': list(COLLECTION_EVENTS)}},
+        {'operationType': 'update', 'ns.coll': 'claims'},
+    ]}}
+    while True:
+        try:
+            async with db.watch([match], full_document='updateLookup') as stream:
+                async for change in stream:
+                    doc = change.get('fullDocument')
+                    if doc:
+                        kind = COLLECTION_EVENTS[change['ns']['coll']]
+                        if kind == 'verification':
+                            await hydrate_evidence([doc])
+                        bus.publish(kind, summary_view(kind, doc))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Change stream error: {e}")
+            await asyncio.sleep(5)
@@ -0,0 +1,45 @@
+import asyncio
+import aiohttp
+from .config import settings
+
+# Shared HTTP client used by every agent.
+# One pooled ClientSession per process keeps TCP/TLS connections alive between
+# calls instead of paying a fresh handshake for every request.
+
+_session: aiohttp.ClientSession | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+
+def _build_session():
+    connector = aiohttp.TCPConnector(
+        limit=settings.HTTP_POOL_SIZE,
+        limit_per_host=settings.HTTP_POOL_PER_HOST,
+        ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL_SEC,
+        keepalive_timeout=settings.HTTP_KEEPALIVE_SEC,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=settings.HTTP_TIMEOUT_SEC,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SEC,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+def get_session():
+    """
+    Returns the process-wide session, creating it on first use.
+    The app starts it explicitly at startup; scripts and tests get it lazily.
+    """
+    global _session, _loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _loop is not loop:
+        _session = _build_session()
+        _loop = loop
+    return _session
+
+async def start_http():
+    return get_session()
+
+async def close_http():
+    global _session, _loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _loop = None
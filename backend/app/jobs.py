@@ -0,0 +1,170 @@
+# Request coalescing and background jobs for ad-hoc verifications.
+# verify_text() lets concurrent requests for the same claim share one
+# in-flight pipeline run. JobPool runs /verify-text?mode=async requests on a
+# bounded set of workers and keeps their state in the `jobs` collection so any
+# replica can answer status queries.
+
+import asyncio
+import datetime
+from bson import ObjectId
+from .config import settings
+from . import metrics
+from .db import jobs
+from .utils import normalize_text
+from .agents.verifier import verify_claim_text, verify_slots
+from .agents.dedup import cached_result
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its result."""
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn, *args):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn(*args))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # a caller that disconnects must not cancel the work others wait on
+        return await asyncio.shield(task)
+
+    def __len__(self):
+        return len(self._calls)
+
+_flights = SingleFlight()
+
+async def _verify_text(text):
+    # reuse a fresh verdict of a near-duplicate claim before spending LLM/search calls
+    cached = await cached_result(text)
+    if cached:
+        return cached
+    return await verify_claim_text(text)
+
+# bookkeeping for verify_claims (stored verifications), not part of API results
+_INTERNAL_FIELDS = ('llm_failed',)
+
+async def verify_text(text):
+    result = await _flights.do(normalize_text(text), _verify_text, text)
+    # a new dict: concurrent callers share the single-flight result
+    return {k: v for k, v in result.items() if k not in _INTERNAL_FIELDS}
+
+async def verify_stream(texts):
+    """
+    Verifies many claims and yields (index, result) as each one finishes;
+    result is the exception for a claim that failed. At most
+    VERIFY_CONCURRENCY claims of a stream are in flight, and every claim also
+    takes a slot of the verifier's global limit, so concurrent batches share
+    one search/LLM budget.
+    """
+    todo = iter(enumerate(texts))
+    pending = set()
+
+    async def run(i, text):
+        try:
+            async with verify_slots():
+                return i, await verify_text(text)
+        except Exception as e:
+            return i, e
+
+    def fill():
+        for i, text in todo:
+            pending.add(asyncio.create_task(run(i, text)))
+            if len(pending) >= settings.VERIFY_CONCURRENCY:
+                break
+
+    fill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                yield task.result()
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+class QueueFull(Exception):
+    pass
+
+class JobPool:
+    def __init__(self):
+        self._queue = None
+        self._workers = []
+        self._finished = {}
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=settings.JOB_QUEUE_SIZE)
+        for _ in range(settings.JOB_WORKERS):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def stop(self):
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, text):
+        """Records a queued job and returns its id. Raises QueueFull when the pool is saturated."""
+        if self._queue is None or self._queue.full():
+            raise QueueFull()
+        job = {'_id': ObjectId(), 'text': text, 'status': 'queued', 'created_at': datetime.datetime.utcnow()}
+        await jobs.insert_one(job)
+        job_id = str(job['_id'])
+        self._finished[job_id] = asyncio.Event()
+        self._queue.put_nowait((job['_id'], text))
+        return job_id
+
+    async def _worker(self):
+        while True:
+            job_id, text = await self._queue.get()
+            try:
+                await jobs.update_one({'_id': job_id}, {'$set': {'status': 'running'}})
+                update = {'status': 'done', 'result': await verify_text(text)}
+            except Exception as e:
+                print(f"Job {job_id} failed: {e}")
+                update = {'status': 'error', 'error': str(e)}
+            update['finished_at'] = datetime.datetime.utcnow()
+            try:
+                await jobs.update_one({'_id': job_id}, {'$set': update})
+            except Exception as e:
+                print(f"Job {job_id} could not be saved: {e}")
+            event = self._finished.pop(str(job_id), None)
+            if event:
+                event.set()
+            self._queue.task_done()
+
+    async def get(self, job_id, wait=0.0):
+        """
+        Returns the job document, or None if unknown. With wait > 0, blocks up
+        to that many seconds for the job to finish.
+        """
+        try:
+            oid = ObjectId(job_id)
+        except Exception:
+            return None
+        if wait > 0:
+            event = self._finished.get(job_id)
+            if event is not None:
+                # job runs in this process
+                try:
+                    await asyncio.wait_for(event.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                # job may run on another replica
+                deadline = asyncio.get_running_loop().time() + wait
+                while True:
+                    job = await jobs.find_one({'_id': oid})
+                    if job is None or job['status'] in ('done', 'error') or asyncio.get_running_loop().time() >= deadline:
+                        break
+                    await asyncio.sleep(settings.JOB_POLL_INTERVAL_SEC)
+        job = await jobs.find_one({'_id': oid})
+        if job:
+            job['_id'] = str(job['_id'])
+        return job
+
+job_pool = JobPool()
+
+metrics.collector('misinfo_job_queue_depth', 'gauge', 'Async verification jobs waiting for a worker',
+                  lambda: [({}, job_pool._queue.qsize() if job_pool._queue else 0)])
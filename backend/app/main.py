@@ -1,16 +1,21 @@
-import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .api.routes import router as api_router
-from .agents.fetcher import fetch_news
-from .agents.claim_extractor import run_extractor
-from .agents.verifier import run_verifier
+from .api.responses import JSONResponse
+from .pipeline import pipeline, schedule
 from .db import init_indexes
+from .http_client import start_http, close_http
+from .events import watch_changes
+from .jobs import job_pool
+from .agents.local_index import load_index
+from .cpu_pools import close_pools
 from .config import settings
+from . import metrics
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import asyncio
 
-app = FastAPI(title='Misinfo Agentic API')
+app = FastAPI(title='Misinfo Agentic API', default_response_class=JSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,25 +23,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 app.include_router(api_router, prefix='/api')
 
+scheduler = AsyncIOScheduler()
+background_tasks = []
+
 @app.on_event('startup')
 async def startup_event():
     await init_indexes()
-    # start a scheduler to run agents periodically
-    scheduler = AsyncIOScheduler()
-    interval = int(settings.SCHED_RUN_INTERVAL_MIN)
-    # fetch -> extract -> verify pipeline (staggered)
-    scheduler.add_job(lambda: asyncio.create_task(fetch_news()), 'interval', minutes=interval, id='fetcher')
-    scheduler.add_job(lambda: asyncio.create_task(run_extractor()), 'interval', minutes=interval, id='extractor', seconds=30)
-    scheduler.add_job(lambda: asyncio.create_task(run_verifier()), 'interval', minutes=interval, id='verifier', seconds=60)
-    scheduler.start()
+    await start_http()
+    background_tasks.append(asyncio.create_task(load_index()))
+    await job_pool.start()
+    if settings.EVENTS_CHANGE_STREAMS:
+        background_tasks.append(asyncio.create_task(watch_changes()))
+    if settings.RUN_AGENTS_IN_API:
+        # fetch -> extract -> verify run as one streaming pipeline; the scheduler
+        # only triggers fetches and backlog sweeps. With RUN_AGENTS_IN_API=false
+        # this runs in `python -m app.worker` processes instead.
+        await pipeline.start()
+        schedule(scheduler)
+        scheduler.start()
+
+@app.on_event('shutdown')
+async def shutdown_event():
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+        await pipeline.drain()
+    await job_pool.stop()
+    for task in background_tasks:
+        task.cancel()
+    close_pools()
+    await close_http()
 
 @app.get('/')
 async def root():
     return {'service': 'misinfo-agentic', 'version': '1.0'}
 
+@app.get('/metrics', response_class=PlainTextResponse)
+async def metrics_endpoint():
+    # Prometheus text exposition format
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
+    import uvicorn
     uvicorn.run('app.main:app', host='0.0.0.0', port=settings.PORT, reload=True)
@@ -0,0 +1,154 @@
+# Minimal Prometheus-format instrumentation (no client library needed).
+# Counters and histograms are updated on the hot path; modules that already
+# keep their own counters (search cache, pipeline queues, ...) register a
+# collector callback that is read only when /metrics is scraped.
+# With TRACE_CLAIMS enabled, every timed() block inside a claim verification
+# is also recorded as a span and the trace is logged when the claim finishes.
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from .config import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry = []
+_collectors = []
+
+def _fmt_labels(names, values):
+    if not names:
+        return ''
+    escape = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    pairs = ','.join(f'{n}="{escape(v)}"' for n, v in zip(names, values))
+    return '{' + pairs + '}'
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        # label values are strings in the output; mixing 200 and 'error' must still sort
+        key = tuple(str(labels.get(n, '')) for n in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} counter'
+        for key, value in sorted(self._values.items()):
+            yield f'{self.name}{_fmt_labels(self.labels, key)} {value}'
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(n, '')) for n in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        for key, (counts, total, count) in sorted(self._series.items()):
+            for bound, c in zip(self.buckets, counts):
+                yield f'{self.name}_bucket{_fmt_labels(self.labels + ("le",), key + (bound,))} {c}'
+            yield f'{self.name}_bucket{_fmt_labels(self.labels + ("le",), key + ("+Inf",))} {count}'
+            yield f'{self.name}_sum{_fmt_labels(self.labels, key)} {total}'
+            yield f'{self.name}_count{_fmt_labels(self.labels, key)} {count}'
+
+def collector(name, kind, help, fn):
+    """Registers a callback returning [(labels dict, value), ...], read at scrape time."""
+    _collectors.append((name, kind, help, fn))
+
+def render():
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    for name, kind, help, fn in _collectors:
+        lines.append(f'# HELP {name} {help}')
+        lines.append(f'# TYPE {name} {kind}')
+        try:
+            for labels, value in fn():
+                lines.append(f'{name}{_fmt_labels(tuple(labels), tuple(labels.values()))} {value}')
+        except Exception as e:
+            lines.append(f'# collector error: {e}')
+    return '\n'.join(lines) + '\n'
+
+# --- Shared metrics ---
+stage_seconds = Histogram('misinfo_stage_seconds', 'Time spent per pipeline stage', ['stage'])
+stage_errors = Counter('misinfo_stage_errors_total', 'Exceptions raised per pipeline stage', ['stage'])
+provider_seconds = Histogram('misinfo_provider_request_seconds', 'Upstream request latency per attempt', ['provider'])
+provider_responses = Counter('misinfo_provider_responses_total', 'Upstream responses by status (error = no response)', ['provider', 'status'])
+provider_rejected = Counter('misinfo_provider_rejected_total', 'Calls skipped by the circuit breaker or rate limiter', ['provider', 'reason'])
+mongo_seconds = Histogram('misinfo_mongo_command_seconds', 'MongoDB command latency', ['command'])
+mongo_failures = Counter('misinfo_mongo_command_failures_total', 'Failed MongoDB commands', ['command'])
+decompositions = Counter('misinfo_decompositions_total', 'Claims searched as-is (skipped) or decomposed alongside a speculative search', ['path'])
+items_processed = Counter('misinfo_items_total', 'Documents produced per stage', ['kind'])
+
+# --- Tracing ---
+_trace = ContextVar('misinfo_trace', default=None)
+
+@contextmanager
+def timed(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        stage_errors.inc(stage=stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_seconds.observe(elapsed, stage=stage)
+        spans = _trace.get()
+        if spans is not None:
+            spans.append((stage, start, elapsed))
+
+@contextmanager
+def trace(name):
+    """Collects the spans of every timed() block run inside (including child tasks) and logs them."""
+    if not settings.TRACE_CLAIMS:
+        yield
+        return
+    spans = []
+    token = _trace.set(spans)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _trace.reset(token)
+        total = time.perf_counter() - start
+        parts = ', '.join(f'{stage}@{(s - start) * 1000:.0f}ms+{d * 1000:.0f}ms' for stage, s, d in spans)
+        print(f"Trace [{name[:60]}] {total * 1000:.0f}ms: {parts}")
+
+# --- MongoDB command monitoring ---
+try:
+    from pymongo import monitoring
+
+    class MongoCommandListener(monitoring.CommandListener):
+        def started(self, event):
+            pass
+
+        def succeeded(self, event):
+            mongo_seconds.observe(event.duration_micros / 1e6, command=event.command_name)
+
+        def failed(self, event):
+            mongo_seconds.observe(event.duration_micros / 1e6, command=event.command_name)
+            mongo_failures.inc(command=event.command_name)
+except ImportError:
+    MongoCommandListener = None
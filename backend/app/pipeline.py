@@ -0,0 +1,191 @@
+# Streaming fetch -> extract -> verify pipeline.
+# Each stage is a pool of workers reading from a bounded queue, so a slow stage
+# pushes back on the one before it instead of piling up work. New raw items
+# flow straight into extraction and new claims straight into verification,
+# rather than waiting for the next scheduled run of each agent.
+# Several processes can run the pipeline at once: only the holder of the
+# 'fetch' lease fetches news, and every document is claimed in MongoDB before
+# it is queued, so each one is processed by exactly one worker. The claim is
+# renewed when a worker takes a doc off the queue; docs whose claim expired
+# while queued and were taken by another worker are dropped.
+
+import asyncio
+from bson import ObjectId
+from .config import settings
+from . import metrics
+from .agents.fetcher import fetch_news
+from .agents.claim_extractor import extract_batch
+from .agents.verifier import verify_claims
+from .coordination import (LeaderLease, claim_raw_items, claim_unverified, renew_raw_items, renew_claims,
+                           release_raw_items, release_claims)
+
+async def _take(queue, max_items):
+    # wait for one item, then grab whatever else is already queued
+    batch = [await queue.get()]
+    while len(batch) < max_items and not queue.empty():
+        batch.append(queue.get_nowait())
+    return batch
+
+def _free(queue):
+    return queue.maxsize - queue.qsize()
+
+def _empty(queue):
+    docs = []
+    while not queue.empty():
+        docs.append(queue.get_nowait())
+    return docs
+
+class Pipeline:
+    def __init__(self):
+        self.extract_queue = None
+        self.verify_queue = None
+        self._workers = []
+        self._tick_lock = asyncio.Lock()
+        self._sweep_lock = asyncio.Lock()
+        self.lease = LeaderLease('fetch')
+        # str(_id) -> (queue, doc), for every doc queued or being processed
+        self._in_flight = {}
+        self._closing = False
+
+    def depths(self):
+        return {
+            'extract': self.extract_queue.qsize() if self.extract_queue else 0,
+            'verify': self.verify_queue.qsize() if self.verify_queue else 0,
+        }
+
+    async def start(self):
+        self.extract_queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+        self.verify_queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+        self._closing = False
+        self.lease.start()
+        for _ in range(settings.PIPELINE_EXTRACT_WORKERS):
+            self._workers.append(asyncio.create_task(self._extract_worker()))
+        for _ in range(settings.PIPELINE_VERIFY_WORKERS):
+            self._workers.append(asyncio.create_task(self._verify_worker()))
+
+    async def tick(self):
+        """
+        Scheduled entry point: fetch new items (lease holder only), then claim
+        any backlog. Ticks never overlap; a tick that fires while the previous
+        one is still running is skipped.
+        """
+        if self._closing or self._tick_lock.locked():
+            print('Pipeline tick skipped: previous tick still running')
+            return
+        async with self._tick_lock:
+            try:
+                with metrics.timed('tick'):
+                    if self.lease.is_leader:
+                        ids = [ObjectId(item['_id']) for item in await fetch_news()]
+                        for item in await claim_raw_items(len(ids), ids):
+                            await self._enqueue(self.extract_queue, item)
+                    else:
+                        print('Pipeline tick: another worker holds the fetch lease')
+            except Exception as e:
+                print(f"Pipeline tick error: {e}")
+        await self.sweep()
+
+    async def sweep(self):
+        """
+        Claims backlog (unextracted items, unverified claims, claims whose
+        worker died) up to the free space in each queue.
+        """
+        if self._closing or self._sweep_lock.locked():
+            return
+        async with self._sweep_lock:
+            try:
+                for item in await claim_raw_items(_free(self.extract_queue)):
+                    await self._enqueue(self.extract_queue, item)
+                for claim in await claim_unverified(_free(self.verify_queue)):
+                    await self._enqueue(self.verify_queue, claim)
+            except Exception as e:
+                print(f"Pipeline sweep error: {e}")
+
+    async def _enqueue(self, queue, doc):
+        # blocks while the queue is full (backpressure); skips docs already queued
+        key = str(doc['_id'])
+        if key in self._in_flight:
+            # re-claimed after its deadline passed while queued: keep the new token
+            self._in_flight[key][1]['claim_token'] = doc.get('claim_token')
+            return
+        self._in_flight[key] = (queue, doc)
+        await queue.put(doc)
+
+    def _done(self, queue, docs):
+        for doc in docs:
+            self._in_flight.pop(str(doc['_id']), None)
+            queue.task_done()
+
+    # A cancelled worker (drain timeout) skips _done, so its batch stays in
+    # _in_flight and is released by drain().
+    async def _extract_worker(self):
+        while True:
+            items = await _take(self.extract_queue, settings.EXTRACT_BATCH_SIZE)
+            try:
+                held = await renew_raw_items(items)
+                ids = [ObjectId(claim['_id']) for claim in await extract_batch(held)] if held else []
+                for claim in await claim_unverified(len(ids), ids):
+                    await self._enqueue(self.verify_queue, claim)
+            except Exception as e:
+                print(f"Pipeline extract error: {e}")
+            self._done(self.extract_queue, items)
+
+    async def _verify_worker(self):
+        while True:
+            batch = await _take(self.verify_queue, settings.LLM_BATCH_MAX_CLAIMS)
+            try:
+                held = await renew_claims(batch)
+                if held:
+                    await verify_claims(held)
+            except Exception as e:
+                print(f"Pipeline verify error: {e}")
+            self._done(self.verify_queue, batch)
+
+    async def drain(self, timeout=None):
+        """
+        Stops accepting ticks, lets queued work finish (up to timeout), then
+        stops workers and hands unprocessed claimed docs back to other workers.
+        """
+        self._closing = True
+        timeout = settings.PIPELINE_DRAIN_TIMEOUT_SEC if timeout is None else timeout
+        try:
+            if self.extract_queue is not None:
+                await asyncio.wait_for(self._join(), timeout)
+        except asyncio.TimeoutError:
+            print(f"Pipeline drain timed out, depths: {self.depths()}")
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.lease.stop()
+        if self.extract_queue is not None:
+            # queued docs and the batches of cancelled workers; finished docs
+            # no longer match the pending query and are left alone
+            left = list(self._in_flight.values())
+            self._in_flight.clear()
+            _empty(self.extract_queue)
+            _empty(self.verify_queue)
+            try:
+                await release_raw_items([d['_id'] for q, d in left if q is self.extract_queue])
+                await release_claims([d['_id'] for q, d in left if q is self.verify_queue])
+            except Exception as e:
+                print(f"Pipeline release error: {e}")
+
+    async def _join(self):
+        # wait for an in-progress tick to finish enqueueing first
+        async with self._tick_lock:
+            pass
+        await self.extract_queue.join()
+        await self.verify_queue.join()
+
+pipeline = Pipeline()
+
+def schedule(scheduler):
+    interval = int(settings.SCHED_RUN_INTERVAL_MIN)
+    scheduler.add_job(pipeline.tick, 'interval', minutes=interval, id='pipeline', max_instances=1, coalesce=True)
+    scheduler.add_job(pipeline.sweep, 'interval', seconds=settings.PIPELINE_SWEEP_SEC, id='sweep', max_instances=1, coalesce=True)
+
+metrics.collector('misinfo_pipeline_queue_depth', 'gauge', 'Documents waiting in each pipeline queue',
+                  lambda: [({'stage': stage}, n) for stage, n in pipeline.depths().items()])
+metrics.collector('misinfo_pipeline_in_flight', 'gauge', 'Documents queued or being processed by the pipeline',
+                  lambda: [({}, len(pipeline._in_flight))])
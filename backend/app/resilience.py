@@ -0,0 +1,153 @@
+# Rate limiting, retries and circuit breaking for upstream providers
+# (OpenAI, NewsAPI, Google CSE, Reddit).
+# Every provider gets a token bucket so we stay under its rate limit, retries
+# with jittered exponential backoff that honour Retry-After, and a circuit
+# breaker that fails fast for a cool-down period once the provider keeps
+# failing, so one bad upstream cannot stretch every verification.
+
+import asyncio
+import random
+import time
+import aiohttp
+from .config import settings
+from .http_client import get_session
+from . import metrics
+
+class UpstreamError(Exception):
+    def __init__(self, provider, status, detail):
+        super().__init__(f"{provider} returned {status}: {detail[:200]}")
+        self.provider = provider
+        self.status = status
+
+class ProviderUnavailable(UpstreamError):
+    def __init__(self, provider, reason):
+        Exception.__init__(self, f"{provider} unavailable: {reason}")
+        self.provider = provider
+        self.status = None
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, max_wait):
+        """Takes one token, waiting for it if needed. Returns False if that would take longer than max_wait."""
+        self._refill()
+        # reserve the token now so concurrent callers queue up behind each other
+        wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+        if wait > max_wait:
+            return False
+        self.tokens -= 1
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+class CircuitBreaker:
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half-open'
+
+    def allow(self):
+        # half-open lets requests through again; the next result closes or re-opens it
+        return self.state != 'open'
+
+    def success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold or self.state == 'half-open':
+            self.opened_at = time.monotonic()
+
+class Provider:
+    def __init__(self, name):
+        rate = settings.PROVIDER_RATE_LIMITS.get(name, settings.PROVIDER_DEFAULT_RATE)
+        self.name = name
+        self.bucket = TokenBucket(rate, max(1.0, rate * settings.PROVIDER_BURST_SEC))
+        self.breaker = CircuitBreaker(settings.BREAKER_FAILURE_THRESHOLD, settings.BREAKER_COOLDOWN_SEC)
+
+_providers = {}
+
+def get_provider(name):
+    if name not in _providers:
+        _providers[name] = Provider(name)
+    return _providers[name]
+
+def provider_states():
+    return {name: {'state': p.breaker.state, 'failures': p.breaker.failures} for name, p in _providers.items()}
+
+def _retry_after(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+def _backoff(attempt):
+    # "full jitter": uniform in [0, base * 2^attempt], capped
+    return random.uniform(0, min(settings.RETRY_MAX_DELAY_SEC, settings.RETRY_BASE_DELAY_SEC * 2 ** attempt))
+
+async def request_json(provider, method, url, **kwargs):
+    """
+    Calls an upstream through its provider's limiter, retry policy and breaker
+    and returns the JSON body of a 200 response. Raises ProviderUnavailable
+    when the breaker is open or the limiter queue is too long, and
+    UpstreamError for other failures once retries are exhausted.
+    """
+    p = get_provider(provider)
+    error = None
+    for attempt in range(settings.RETRY_MAX_ATTEMPTS):
+        if not p.breaker.allow():
+            metrics.provider_rejected.inc(provider=provider, reason='circuit_open')
+            raise error or ProviderUnavailable(provider, 'circuit open')
+        if not await p.bucket.acquire(settings.RATE_LIMIT_MAX_WAIT_SEC):
+            metrics.provider_rejected.inc(provider=provider, reason='rate_limited')
+            raise ProviderUnavailable(provider, 'rate limit queue full')
+
+        retry_after = None
+        start = time.perf_counter()
+        try:
+            session = get_session()
+            async with getattr(session, method.lower())(url, **kwargs) as resp:
+                metrics.provider_responses.inc(provider=provider, status=resp.status)
+                if resp.status == 200:
+                    data = await resp.json()
+                    p.breaker.success()
+                    return data
+                error = UpstreamError(provider, resp.status, await resp.text())
+                if resp.status != 429 and resp.status < 500:
+                    # our request was bad, the provider is fine: don't retry or trip the breaker
+                    raise error
+                retry_after = _retry_after(resp.headers.get('Retry-After'))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            metrics.provider_responses.inc(provider=provider, status='error')
+            error = UpstreamError(provider, None, str(e) or type(e).__name__)
+        finally:
+            metrics.provider_seconds.observe(time.perf_counter() - start, provider=provider)
+
+        p.breaker.failure()
+        if attempt + 1 >= settings.RETRY_MAX_ATTEMPTS:
+            break
+        delay = retry_after if retry_after is not None else _backoff(attempt)
+        if delay > settings.RETRY_MAX_DELAY_SEC:
+            # waiting that long would blow the latency budget; give up now
+            break
+        await asyncio.sleep(delay)
+    raise error
@@ -1,4 +1,28 @@
 import datetime
+import re
+import zlib
+from .config import settings
 
 def now_iso():
     return datetime.datetime.utcnow().isoformat() + 'Z'
+
+def normalize_text(text: str):
+    # lowercase, drop punctuation and collapse whitespace
+    text = re.sub(r'[^\w\s]', ' ', (text or '').lower())
+    return ' '.join(text.split())
+
+# Article bodies are stored zlib-compressed in raw_items.body_z and only
+# decompressed by the code that reads the text (extractor, local index,
+# /api/items?view=full).
+def compress_text(text: str):
+    text = (text or '')[:settings.ARTICLE_TEXT_MAX_CHARS]
+    return zlib.compress(text.encode('utf-8'), settings.ARTICLE_TEXT_COMPRESS_LEVEL)
+
+def decompress_text(blob):
+    return zlib.decompress(blob).decode('utf-8') if blob else ''
+
+def article_text(item):
+    # items stored before compression keep the plain text in meta.full_text
+    if item.get('body_z'):
+        return decompress_text(item['body_z'])
+    return (item.get('meta') or {}).get('full_text') or ''
@@ -0,0 +1,47 @@
+# Standalone agent worker, for running the agents apart from the API:
+#
+#   python -m app.worker
+#
+# Start as many as needed and set RUN_AGENTS_IN_API=false on the API
+# replicas. The news fetch runs on whichever worker holds the 'fetch' lease;
+# extraction and verification are claimed per document, so workers split the
+# backlog without processing anything twice. Live updates reach the API's
+# /api/stream only through MongoDB change streams (EVENTS_CHANGE_STREAMS).
+
+import asyncio
+import signal
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from .db import init_indexes
+from .http_client import start_http, close_http
+from .agents.local_index import load_index
+from .cpu_pools import close_pools
+from .coordination import WORKER_ID
+from .pipeline import pipeline, schedule
+
+async def main():
+    await init_indexes()
+    await start_http()
+    index_task = asyncio.create_task(load_index())
+    await pipeline.start()
+    scheduler = AsyncIOScheduler()
+    schedule(scheduler)
+    scheduler.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    print(f"Worker {WORKER_ID} started")
+    # claim any backlog right away instead of waiting for the first sweep
+    await pipeline.sweep()
+    await stop.wait()
+
+    print(f"Worker {WORKER_ID} stopping")
+    scheduler.shutdown(wait=False)
+    await pipeline.drain()
+    index_task.cancel()
+    close_pools()
+    await close_http()
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,399 @@
+# Offline throughput/latency benchmark for the agents and the API.
+# Starts a local stand-in for every upstream the agents call (OpenAI, NewsAPI,
+# Google CSE, Reddit and the article pages) with configurable latency and error
+# rate, points the settings at it and drives each stage under concurrent load.
+# Reports throughput and p50/p95/p99 latency per scenario; --out saves the
+# report and --baseline compares against a saved one (exit 1 on regression).
+#
+#   pip install -r requirements-bench.txt
+#   python bench_pipeline.py --mongo memory --claims 200 --concurrency 16 --out before.json
+#   python bench_pipeline.py --mongo memory --claims 200 --concurrency 16 --baseline before.json
+#
+# --mongo memory uses mongomock-motor; --mongo URI runs against a real server
+# (the database name must contain "bench", it is dropped before and after).
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+from aiohttp import web
+
+TOPICS = ['coffee', 'vaccines', 'solar panels', 'sugar', '5G towers', 'vitamin D', 'tap water', 'electric cars']
+SENTENCES = [
+    'A new study shows that {t} cause memory loss in adults',
+    'Researchers say {t} prevent heart disease when used daily',
+    'Officials announced a ban on {t} starting next month',
+    'Experts claim {t} cure seasonal allergies within a week',
+    'The weather was pleasant and people enjoyed the afternoon',
+]
+
+# --- 1. Upstream stand-ins ---
+class MockUpstreams:
+    """aiohttp app answering like the real providers, with injected latency and errors."""
+
+    def __init__(self, latency_ms, jitter_ms, error_rate, seed):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = {}
+        self._headline = 0
+
+    @web.middleware
+    async def _inject(self, request, handler):
+        route = request.path.split('/')[1]
+        self.requests[route] = self.requests.get(route, 0) + 1
+        await asyncio.sleep(max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter)))
+        if self.rng.random() < self.error_rate:
+            return web.json_response({'error': 'injected'}, status=503)
+        return await handler(request)
+
+    def app(self):
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_post('/openai/chat/completions', self.chat_completions)
+        app.router.add_get('/newsapi/top-headlines', self.headlines)
+        app.router.add_get('/newsapi/everything', self.everything)
+        app.router.add_get('/google', self.google)
+        app.router.add_get('/reddit/search.json', self.reddit)
+        app.router.add_get('/article/{n}', self.article)
+        return app
+
+    async def chat_completions(self, request):
+        prompt = (await request.json())['messages'][1]['content']
+        claim = re.search(r'Claim: "(.*)"', prompt)
+        if 'Break down the following claim' in prompt:
+            text = claim.group(1) if claim else 'claim'
+            payload = {'queries': [text, f'{text} fact check']}
+        elif re.search(r'Claim \d+:', prompt):
+            ids = sorted({int(i) for i in re.findall(r'Claim (\d+):', prompt)})
+            payload = {'results': [{'id': i, 'verdict': 'FALSE', 'confidence': 0.8, 'summary': 'Mock batch verdict.'} for i in ids]}
+        else:
+            payload = {'verdict': 'FALSE', 'confidence': 0.8, 'summary': 'Mock verdict.'}
+        return web.json_response({'choices': [{'message': {'content': json.dumps(payload)}}]})
+
+    async def headlines(self, request):
+        base = f'{request.scheme}://{request.host}'
+        articles = []
+        for _ in range(int(request.query.get('pageSize', 20))):
+            self._headline += 1
+            n = self._headline
+            articles.append({
+                'source': {'name': 'Mock Wire'},
+                'url': f'{base}/article/{n}',
+                'title': f'Headline {n} about {TOPICS[n % len(TOPICS)]}',
+                'description': f'Summary of story {n}.',
+            })
+        return web.json_response({'status': 'ok', 'articles': articles})
+
+    async def everything(self, request):
+        q = request.query.get('q', '')
+        return web.json_response({'articles': [{
+            'title': f'{q} report {i}', 'description': f'Coverage of {q}, part {i}.',
+            'url': f'https://news.example/{abs(hash(q))}/{i}', 'source': {'name': 'Mock News'}
+        } for i in range(5)]})
+
+    async def google(self, request):
+        q = request.query.get('q', '')
+        return web.json_response({'items': [{
+            'title': f'{q} result {i}', 'snippet': f'Fact check of {q}, finding {i}.',
+            'link': f'https://factcheck.example/{abs(hash(q))}/{i}', 'displayLink': 'factcheck.example'
+        } for i in range(5)]})
+
+    async def reddit(self, request):
+        q = request.query.get('q', '')
+        return web.json_response({'data': {'children': [{'data': {
+            'title': f'{q} thread {i}', 'selftext': f'Discussion about {q}.',
+            'permalink': f'/r/news/comments/{abs(hash(q))}{i}', 'subreddit_name_prefixed': 'r/news'
+        }} for i in range(5)]}})
+
+    async def article(self, request):
+        n = int(request.match_info['n'])
+        paragraphs = ''.join(f'<p>{article_text(n * 20 + i, 3)}</p>' for i in range(20))
+        return web.Response(text=f'<html><body><h1>Story {n}</h1>{paragraphs}</body></html>', content_type='text/html')
+
+def article_text(n, sentences=12):
+    return ' '.join(SENTENCES[(n + i) % len(SENTENCES)].format(t=TOPICS[(n * 7 + i) % len(TOPICS)]) + f' (report {n}-{i}).' for i in range(sentences))
+
+def claim_text(n):
+    return f'{SENTENCES[n % 4].format(t=TOPICS[n % len(TOPICS)])} according to report {n}'
+
+# --- 2. Measurement ---
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    # nearest-rank
+    k = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+def summarize(latencies, errors, wall, units, unit):
+    lat = sorted(latencies)
+    ms = lambda v: round(v * 1000, 2) if v is not None else None
+    return {
+        'samples': len(lat), 'errors': errors, 'wall_sec': round(wall, 3),
+        'throughput': round(units / wall, 2) if wall else 0.0, 'unit': unit,
+        'mean_ms': ms(statistics.mean(lat)) if lat else None,
+        'p50_ms': ms(percentile(lat, 50)), 'p95_ms': ms(percentile(lat, 95)), 'p99_ms': ms(percentile(lat, 99)),
+    }
+
+async def load(fn, args_list, concurrency):
+    """Runs fn(*args) for every entry with at most `concurrency` in flight. Returns (latencies, errors, wall)."""
+    slots = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def _one(args):
+        nonlocal errors
+        async with slots:
+            start = time.perf_counter()
+            try:
+                await fn(*args)
+            except Exception as e:
+                errors += 1
+                print(f'  error: {type(e).__name__}: {e}')
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_one(a) for a in args_list])
+    return latencies, errors, time.perf_counter() - start
+
+# --- 3. Scenarios ---
+async def bench_verify_claim_text(args):
+    from app.agents.verifier import verify_claim_text
+    texts = [(claim_text(i),) for i in range(args.claims)]
+    lat, errors, wall = await load(verify_claim_text, texts, args.concurrency)
+    return summarize(lat, errors, wall, len(lat), 'claims/s')
+
+async def bench_run_verifier(args):
+    from app.db import claims
+    from app.agents.verifier import run_verifier
+    from app.agents.dedup import fingerprint
+    from app.utils import now_iso
+    lat, errors, done = [], 0, 0
+    start = time.perf_counter()
+    for r in range(args.rounds):
+        docs = []
+        for i in range(args.batch):
+            text = claim_text(100000 + r * args.batch + i)
+            docs.append({'raw_id': 'bench', 'text': text, 'extracted_at': now_iso(), 'status': 'unverified', **fingerprint(text)})
+        await claims.insert_many(docs)
+        t = time.perf_counter()
+        try:
+            done += len(await run_verifier(limit=args.batch))
+            lat.append(time.perf_counter() - t)
+        except Exception as e:
+            errors += 1
+            print(f'  error: {type(e).__name__}: {e}')
+    return summarize(lat, errors, time.perf_counter() - start, done, 'claims/s')
+
+async def bench_fetch_news(args):
+    from app.agents.fetcher import fetch_news
+    fetched = []
+
+    async def _fetch():
+        fetched.extend(await fetch_news())
+    lat, errors, wall = await load(_fetch, [() for _ in range(args.rounds)], 1)
+    return summarize(lat, errors, wall, len(fetched), 'items/s')
+
+async def bench_run_extractor(args):
+    from app.db import raw_items
+    from app.agents.claim_extractor import run_extractor
+    from app.utils import now_iso, compress_text
+    lat, errors, done = [], 0, 0
+    start = time.perf_counter()
+    for r in range(args.rounds):
+        base = 200000 + r * args.batch
+        await raw_items.insert_many([{
+            'source': 'bench', 'url': f'https://bench.example/{base + i}', 'title': f'Bench item {base + i}',
+            'summary': '', 'fetched_at': now_iso(), 'extracted': False, 'meta': {}, 'body_z': compress_text(article_text(base + i))
+        } for i in range(args.batch)])
+        pending = await raw_items.count_documents({'extracted': False})
+        t = time.perf_counter()
+        try:
+            await run_extractor()
+            lat.append(time.perf_counter() - t)
+            done += pending
+        except Exception as e:
+            errors += 1
+            print(f'  error: {type(e).__name__}: {e}')
+    return summarize(lat, errors, time.perf_counter() - start, done, 'items/s')
+
+async def bench_api(args):
+    import httpx
+    from app.main import app
+    requests = [('GET', '/api/items?limit=50&view=summary', None),
+                ('GET', '/api/claims?limit=50', None),
+                ('GET', '/api/verifications?limit=50', None),
+                ('GET', '/api/verifications?limit=50&view=summary', None),
+                ('POST', '/api/verify-text', 'text')]
+    results = {}
+    async with httpx.AsyncClient(app=app, base_url='http://bench', timeout=None) as client:
+        for method, path, body in requests:
+            async def _call(i):
+                payload = {'text': claim_text(300000 + i)} if body else None
+                r = await client.request(method, path, json=payload)
+                r.raise_for_status()
+            lat, errors, wall = await load(_call, [(i,) for i in range(args.requests)], args.concurrency)
+            results[f'api {method} {path}'] = summarize(lat, errors, wall, len(lat), 'req/s')
+    return results
+
+SCENARIOS = {
+    'verify_claim_text': bench_verify_claim_text,
+    'run_verifier': bench_run_verifier,
+    'fetch_news': bench_fetch_news,
+    'run_extractor': bench_run_extractor,
+    'api': bench_api,
+}
+
+# --- 4. Setup, reporting and comparison ---
+def configure_env(args, base):
+    # settings are read when app.config is first imported, so this runs before any app import
+    os.environ.update({
+        'MONGO_URI': args.mongo if args.mongo != 'memory' else 'mongodb://localhost:27017/misinfo_bench',
+        'OPENAI_API_KEY': 'bench', 'OPENAI_API_BASE': f'{base}/openai',
+        'NEWSAPI_KEY': 'bench', 'NEWSAPI_API_BASE': f'{base}/newsapi',
+        'GOOGLE_CSE_API_KEY': 'bench', 'GOOGLE_CSE_ID': 'bench', 'GOOGLE_CSE_API_BASE': f'{base}/google',
+        'REDDIT_API_BASE': f'{base}/reddit',
+        'LOCAL_INDEX_PATH': os.path.join(tempfile.mkdtemp(prefix='misinfo-bench-'), 'index.pkl'),
+        'RETRY_BASE_DELAY_SEC': str(args.retry_delay),
+    })
+    if not args.real_rate_limits:
+        # measure our code, not the production quotas
+        os.environ['PROVIDER_RATE_LIMITS'] = json.dumps({p: 1e6 for p in ('openai', 'newsapi', 'google', 'reddit')})
+
+def use_memory_mongo():
+    """Rebinds every app module's collection handles to an in-memory mongomock database."""
+    from mongomock_motor import AsyncMongoMockClient
+    from motor.motor_asyncio import AsyncIOMotorCollection
+    import app.db
+    memory = AsyncMongoMockClient()['misinfo_bench']
+    originals = {name: obj for name, obj in vars(app.db).items() if isinstance(obj, AsyncIOMotorCollection)}
+    for module in [m for name, m in sys.modules.items() if name.startswith('app.') or name == 'app']:
+        for name, original in originals.items():
+            if getattr(module, name, None) is original:
+                setattr(module, name, memory[name])
+    app.db.db = memory
+
+async def reset_db(args):
+    import app.db
+    if args.mongo == 'memory':
+        for name in await app.db.db.list_collection_names():
+            await app.db.db[name].delete_many({})
+        return
+    await app.db.client.drop_database(app.db.db.name)
+
+def print_report(report, baseline=None):
+    print(f"\n{'scenario':50} {'samples':>7} {'err':>4} {'throughput':>16} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, s in report['scenarios'].items():
+        line = (f"{name:50} {s['samples']:7} {s['errors']:4} {s['throughput']:>10} {s['unit']:<5} "
+                f"{s['p50_ms'] or '-':>9} {s['p95_ms'] or '-':>9} {s['p99_ms'] or '-':>9}")
+        old = (baseline or {}).get('scenarios', {}).get(name)
+        if old:
+            line += f"   vs baseline: {change(s['throughput'], old['throughput']):+.0%} throughput, {change(s['p95_ms'], old['p95_ms']):+.0%} p95"
+        print(line)
+    print(f"\nupstream requests: {report['upstream_requests']}")
+
+def change(new, old):
+    return (new - old) / old if new is not None and old else 0.0
+
+def regressions(report, baseline, tolerance):
+    found = []
+    for name, s in report['scenarios'].items():
+        old = baseline.get('scenarios', {}).get(name)
+        if not old:
+            continue
+        if change(s['throughput'], old['throughput']) < -tolerance:
+            found.append(f'{name}: throughput {old["throughput"]} -> {s["throughput"]} {s["unit"]}')
+        if change(s['p95_ms'], old['p95_ms']) > tolerance:
+            found.append(f'{name}: p95 {old["p95_ms"]} -> {s["p95_ms"]} ms')
+    return found
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+async def main(args):
+    mock = MockUpstreams(args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    runner = web.AppRunner(mock.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', args.port)
+    await site.start()
+    configure_env(args, f'http://127.0.0.1:{args.port}')
+
+    if args.mongo == 'memory':
+        import app.main  # noqa: F401  (load every module before rebinding the collections)
+        use_memory_mongo()
+    elif 'bench' not in urlparse(args.mongo).path:
+        sys.exit('Refusing to use a database whose name does not contain "bench"')
+    from app.db import init_indexes
+    from app.http_client import close_http
+
+    await reset_db(args)
+    await init_indexes()
+    scenarios = {}
+    try:
+        for name in args.scenarios:
+            print(f'Running {name} ...')
+            result = await SCENARIOS[name](args)
+            scenarios.update(result if name == 'api' else {name: result})
+    finally:
+        await reset_db(args)
+        await close_http()
+        await runner.cleanup()
+
+    return {
+        'revision': git_revision(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {k: v for k, v in vars(args).items() if k not in ('out', 'baseline')},
+        'scenarios': scenarios,
+        'upstream_requests': mock.requests,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Offline benchmark of the agents and API against mock upstreams')
+    parser.add_argument('--mongo', default='memory', help="'memory' (mongomock-motor) or a MongoDB URI with a *bench* database")
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--claims', type=int, default=100, help='claims for verify_claim_text')
+    parser.add_argument('--requests', type=int, default=100, help='requests per API endpoint')
+    parser.add_argument('--rounds', type=int, default=5, help='rounds for run_verifier, run_extractor and fetch_news')
+    parser.add_argument('--batch', type=int, default=20, help='claims/items seeded per round')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='mock upstream latency')
+    parser.add_argument('--jitter-ms', type=float, default=20.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of upstream calls answered with 503')
+    parser.add_argument('--retry-delay', type=float, default=0.05, help='RETRY_BASE_DELAY_SEC during the run')
+    parser.add_argument('--real-rate-limits', action='store_true', help='keep PROVIDER_RATE_LIMITS from the environment')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--port', type=int, default=8091)
+    parser.add_argument('--out', help='write the JSON report here')
+    parser.add_argument('--baseline', help='compare against a previous JSON report')
+    parser.add_argument('--max-regression', type=float, default=0.15, help='allowed throughput drop / p95 increase vs baseline')
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Report written to {args.out}')
+    if baseline:
+        found = regressions(report, baseline, args.max_regression)
+        for r in found:
+            print(f'REGRESSION {r}')
+        sys.exit(1 if found else 0)
@@ -0,0 +1,63 @@
+# Cold-start benchmark for the API process.
+# Imports app.main in fresh interpreters and reports import time, peak RSS and
+# whether any heavy ML module got pulled in. Exits non-zero when the median
+# import time exceeds the budget, so it can gate CI or image builds.
+#
+#   python bench_startup.py --runs 5 --budget 1.0
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ['transformers', 'torch', 'langchain']
+
+PROBE = f"""
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'import_sec': elapsed,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy_loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+def run_probe():
+    env = dict(os.environ)
+    # settings require a Mongo URI; the driver does not connect at import time
+    env.setdefault('MONGO_URI', 'mongodb://localhost:27017/misinfo_db')
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure app.main cold-start cost')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=1.0, help='max median import time in seconds')
+    args = parser.parse_args()
+
+    samples = [run_probe() for _ in range(args.runs)]
+    import_times = [s['import_sec'] for s in samples]
+    rss = [s['max_rss_mb'] for s in samples]
+    heavy = sorted({m for s in samples for m in s['heavy_loaded']})
+    median = statistics.median(import_times)
+
+    print(f"Runs:            {args.runs}")
+    print(f"Import app.main: median {median * 1000:.0f} ms, min {min(import_times) * 1000:.0f} ms, max {max(import_times) * 1000:.0f} ms")
+    print(f"Peak RSS:        median {statistics.median(rss):.1f} MB")
+    print(f"Heavy modules:   {', '.join(heavy) if heavy else 'none'}")
+
+    if heavy or median > args.budget:
+        print(f"FAIL: budget is {args.budget:.2f}s with no heavy ML imports")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == '__main__':
+    main()
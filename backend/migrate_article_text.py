@@ -0,0 +1,44 @@
+# One-off migration: compresses article text stored as plain
+# raw_items.meta.full_text into raw_items.body_z (capped to
+# ARTICLE_TEXT_MAX_CHARS). Safe to re-run; readers handle both layouts.
+#
+#   python migrate_article_text.py --dry-run
+#   python migrate_article_text.py --batch 500
+
+import argparse
+import asyncio
+from pymongo import UpdateOne
+from app.db import raw_items
+from app.utils import compress_text
+
+async def migrate(batch_size, dry_run):
+    pending = {'meta.full_text': {'$exists': True}}
+    total = await raw_items.count_documents(pending)
+    print(f"{total} raw item(s) with plain article text")
+    before = after = done = 0
+    last_id = None
+    while True:
+        filt = dict(pending, **({'_id': {'$gt': last_id}} if last_id else {}))
+        docs = await raw_items.find(filt, {'meta.full_text': 1}).sort('_id', 1).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]['_id']
+        ops = []
+        for d in docs:
+            text = d['meta'].get('full_text') or ''
+            body = compress_text(text)
+            before += len(text.encode('utf-8'))
+            after += len(body)
+            ops.append(UpdateOne({'_id': d['_id']}, {'$set': {'body_z': body}, '$unset': {'meta.full_text': ''}}))
+        if not dry_run:
+            await raw_items.bulk_write(ops, ordered=False)
+        done += len(docs)
+        print(f"  {done}/{total}")
+    print(f"Article text bytes: {before} -> {after}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compress plain article text in raw_items')
+    parser.add_argument('--batch', type=int, default=500)
+    parser.add_argument('--dry-run', action='store_true', help='only report what would change')
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch, args.dry_run))
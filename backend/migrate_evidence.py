@@ -0,0 +1,54 @@
+# One-off migration: moves evidence embedded in `verifications` documents into
+# the content-addressed `evidence` collection and replaces it with
+# `evidence_refs`. Safe to re-run; already migrated documents are skipped and
+# the API reads both shapes while it runs.
+#
+#   python migrate_evidence.py --dry-run
+#   python migrate_evidence.py --batch 500
+
+import argparse
+import asyncio
+import bson
+from pymongo import UpdateOne
+from app.db import verifications, evidence, init_indexes
+from app.agents.evidence_store import store_evidence, to_refs
+
+async def migrate(batch_size, dry_run):
+    pending = {'evidence': {'$exists': True}}
+    total = await verifications.count_documents(pending)
+    print(f"{total} verification(s) with embedded evidence")
+    before = after = done = 0
+    last_id = None
+    while True:
+        filt = dict(pending, **({'_id': {'$gt': last_id}} if last_id else {}))
+        docs = await verifications.find(filt).sort('_id', 1).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]['_id']
+        ops = []
+        for d in docs:
+            items = d.get('evidence') or []
+            before += len(bson.encode({'evidence': items}))
+            refs = to_refs(items) if dry_run else await store_evidence(items)
+            after += len(bson.encode({'evidence_refs': refs}))
+            ops.append(UpdateOne({'_id': d['_id']}, {'$set': {'evidence_refs': refs}, '$unset': {'evidence': ''}}))
+        if not dry_run:
+            await verifications.bulk_write(ops, ordered=False)
+        done += len(docs)
+        print(f"  {done}/{total}")
+
+    print(f"Evidence bytes in verifications: {before} -> ~{after}")
+    if not dry_run:
+        print(f"Evidence collection now holds {await evidence.estimated_document_count()} unique item(s)")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Move embedded verification evidence into the evidence collection')
+    parser.add_argument('--batch', type=int, default=500)
+    parser.add_argument('--dry-run', action='store_true', help='only report what would change')
+    args = parser.parse_args()
+
+    async def main():
+        if not args.dry_run:
+            await init_indexes()
+        await migrate(args.batch, args.dry_run)
+    asyncio.run(main())
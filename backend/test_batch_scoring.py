@@ -0,0 +1,57 @@
+import asyncio
+import json
+import re
+from unittest.mock import patch
+from aiohttp import web
+from app.agents.verifier import score_batch_with_llm
+from app.http_client import close_http
+
+# Local stand-in for the OpenAI chat-completions endpoint.
+# Batch requests are answered for every claim except claim 1, so the test also
+# exercises the single-claim fallback.
+requests_seen = []
+
+def completion(payload):
+    return web.json_response({"choices": [{"message": {"content": json.dumps(payload)}}]})
+
+async def chat_completions(request):
+    body = await request.json()
+    prompt = body['messages'][1]['content']
+    ids = sorted({int(i) for i in re.findall(r'Claim (\d+):', prompt)})
+    if ids:
+        requests_seen.append(('batch', ids))
+        return completion({"results": [
+            {"id": i, "verdict": "FALSE", "confidence": 0.9, "summary": f"batch verdict {i}"} for i in ids if i != 1
+        ]})
+    requests_seen.append(('single', None))
+    return completion({"verdict": "TRUE", "confidence": 0.7, "summary": "single verdict"})
+
+async def main():
+    app = web.Application()
+    app.router.add_post('/v1/chat/completions', chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 8089)
+    await site.start()
+
+    items = [(f"Claim text number {i}", [{'source': 'Test', 'title': f't{i}', 'snippet': 's' * 200, 'link': f'l{i}'}]) for i in range(5)]
+    with patch('app.config.settings.OPENAI_API_KEY', 'sk-mock-key'), \
+         patch('app.config.settings.OPENAI_API_BASE', 'http://127.0.0.1:8089/v1'), \
+         patch('app.config.settings.LLM_BATCH_MAX_CLAIMS', 3):
+        results = await score_batch_with_llm(items)
+
+    for i, r in enumerate(results):
+        print(f"Claim {i}: {r}")
+    print(f"Requests: {requests_seen}")
+
+    assert len(results) == 5
+    assert results[1] == ('true', 0.7, ['single verdict'])
+    assert all(results[i][0] == 'false' for i in (0, 2, 3, 4))
+    assert sorted(r for r in requests_seen if r[0] == 'batch') == [('batch', [0, 1, 2]), ('batch', [3, 4])]
+    print("\nBatch scoring OK")
+
+    await close_http()
+    await runner.cleanup()
+
+if __name__ == "__main__":
+    asyncio.run(main())
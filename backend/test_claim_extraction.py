@@ -0,0 +1,86 @@
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+from app.config import settings
+from app import cpu_pools
+from app.agents.claim_engine import split_sentences, extract_texts, LinearClaimModel
+from app.agents.claim_extractor import extract_from_texts
+
+ARTICLE = (
+    'Dr. Smith of the U.S. health agency spoke on Monday. '
+    'She said the new vaccine causes no serious side effects in adults. '
+    'Prices rose 3.5 percent because demand was high this quarter!\n'
+    'A recent study proves that drinking lemon water cures cancer within days. '
+    'Officials met to discuss the security of the event venue today.'
+)
+
+def check_segmentation():
+    sentences = split_sentences(ARTICLE)
+    for s in sentences:
+        print(f"  {s}")
+    assert len(sentences) == 5
+    assert sentences[0] == 'Dr. Smith of the U.S. health agency spoke on Monday.'
+    assert sentences[2].startswith('Prices rose 3.5 percent')
+
+    # keyword stems match whole words only ("because", "security" do not count)
+    claims = extract_texts([ARTICLE, '', 'Too short. Study says.'])
+    print(f"Keyword claims: {claims}")
+    assert claims == [[
+        'She said the new vaccine causes no serious side effects in adults',
+        'A recent study proves that drinking lemon water cures cancer within days',
+    ], [], []]
+
+def check_linear_model(path):
+    claims = [
+        'The vaccine causes autism in young children',
+        'Drinking bleach cures the virus within hours',
+        'The government banned all cash payments last week',
+        'Scientists proved that 5G towers spread the disease',
+        'Eating garlic prevents infection with the virus',
+        'The new law makes voting illegal for students',
+    ]
+    other = [
+        'Here is what we know so far about the story',
+        'Read more of our coverage on the website',
+        'What do you think about this latest update',
+        'Sign up for our newsletter to get the news',
+        'Thanks to everyone who joined us this evening',
+        'Follow us on social media for the latest news',
+    ]
+    model = LinearClaimModel.train(claims + other, [1] * len(claims) + [0] * len(other), n_features=2 ** 12)
+    model.save(path)
+    scores = LinearClaimModel.load(path).predict(claims + other)
+    print(f"Linear scores: {[round(float(p), 2) for p in scores]}")
+    assert all(p >= 0.5 for p in scores[:len(claims)])
+    assert all(p < 0.5 for p in scores[len(claims):])
+
+    text = 'The vaccine causes autism in many children. Sign up for our newsletter to get the news.'
+    assert extract_texts([text], path) == [['The vaccine causes autism in many children']]
+
+async def check_process_pool(path):
+    # a batch over EXTRACT_POOL_MIN_CHARS is split across worker processes;
+    # results come back in item order
+    texts = [ARTICLE if i % 2 else 'Nothing to see here today.' for i in range(9)]
+    with patch.object(settings, 'EXTRACT_POOL_MIN_CHARS', 100), patch.object(settings, 'EXTRACT_WORKERS', 3):
+        pooled = await extract_from_texts(texts)
+        with patch.object(settings, 'CLAIM_EXTRACTOR', 'linear'), patch.object(settings, 'CLAIM_LINEAR_MODEL', path):
+            pooled_linear = await extract_from_texts(texts)
+    assert pooled == extract_texts(texts)
+    assert pooled_linear == extract_texts(texts, path)
+
+    # a killed worker breaks the pool; the next batch runs on a fresh one
+    for proc in list(cpu_pools._pools['claim-extract']._processes.values()):
+        proc.kill()
+    with patch.object(settings, 'EXTRACT_POOL_MIN_CHARS', 100), patch.object(settings, 'EXTRACT_WORKERS', 3):
+        assert await extract_from_texts(texts) == pooled
+    cpu_pools.close_pools()
+    print("Process pool OK")
+
+if __name__ == "__main__":
+    check_segmentation()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'claim_linear.npz')
+        check_linear_model(path)
+        asyncio.run(check_process_pool(path))
+    print("\nClaim extraction OK")
@@ -0,0 +1,19 @@
+from app import metrics
+
+# Label values of mixed types (HTTP status ints and 'error') must render.
+def main():
+    metrics.provider_responses.inc(provider='reddit', status=200)
+    metrics.provider_responses.inc(provider='reddit', status='error')
+    metrics.provider_responses.inc(provider='reddit', status=200)
+    metrics.provider_seconds.observe(0.2, provider=429)
+    metrics.provider_seconds.observe(0.3, provider='reddit')
+
+    text = metrics.render()
+    print(text)
+    assert 'misinfo_provider_responses_total{provider="reddit",status="200"} 2' in text
+    assert 'misinfo_provider_responses_total{provider="reddit",status="error"} 1' in text
+    assert 'misinfo_provider_request_seconds_count{provider="429"} 1' in text
+    print("Metrics render OK")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from app.agents.verifier import verify_claim_text
+from app.http_client import close_http
 
 # Mock responses for the "Trinity" agents
 MOCK_DECOMPOSE_RESP = {
@@ -24,34 +25,46 @@ async def run_mock_test():
     
     # Patch the aiohttp.ClientSession.post to return our mock responses
     with patch('aiohttp.ClientSession.post') as mock_post:
-        # Setup the mock to return different responses based on the prompt
-        async def async_json_side_effect():
-            # Simple state machine to return decompose then verify
-            if not hasattr(async_json_side_effect, 'call_count'):
-                async_json_side_effect.call_count = 0
-            
-            resp = [MOCK_DECOMPOSE_RESP, MOCK_VERIFY_RESP][async_json_side_effect.call_count]
-            async_json_side_effect.call_count += 1
-            return resp
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json.side_effect = async_json_side_effect
-        mock_resp.__aenter__.return_value = mock_resp
-        mock_post.return_value = mock_resp
-        
-        claim = "Elon Musk is alien?"
-        print(f"Claim: {claim}")
-        
+        # Answer by prompt content: decomposition requests get sub-queries,
+        # everything else gets a verdict (simple claims skip decomposition)
+        prompts = []
+
+        def post_side_effect(url, **kwargs):
+            prompt = kwargs['json']['messages'][1]['content']
+            prompts.append(prompt)
+            mock_resp = MagicMock()
+            mock_resp.status = 200
+            decompose = 'Break down the following claim' in prompt
+            mock_resp.json = AsyncMock(return_value=MOCK_DECOMPOSE_RESP if decompose else MOCK_VERIFY_RESP)
+            mock_resp.__aenter__.return_value = mock_resp
+            return mock_resp
+
+        mock_post.side_effect = post_side_effect
+
         # We also need to mock settings.OPENAI_API_KEY to be truthy so it tries to call the LLM
-        with patch('app.config.settings.OPENAI_API_KEY', 'sk-mock-key'):
-            result = await verify_claim_text(claim)
-            
-            print("\n--- Result (Simulated) ---")
-            print(f"Verdict: {result['verdict']}")
-            print(f"Score: {result['score']}")
-            print(f"Summary: {result['summary']}")
-            print(f"Evidence Count: {len(result['evidence'])}")
+        # Keep the search cache in-process so the test runs without MongoDB
+        with patch('app.config.settings.OPENAI_API_KEY', 'sk-mock-key'), \
+             patch('app.config.settings.SEARCH_CACHE_SHARED', False):
+            for claim, decomposed in [
+                ("Elon Musk is alien?", False),
+                ("Elon Musk is an alien because he was born on Mars, which NASA confirmed in 1971", True),
+            ]:
+                prompts.clear()
+                print(f"Claim: {claim}")
+                result = await verify_claim_text(claim)
+
+                print("\n--- Result (Simulated) ---")
+                print(f"Verdict: {result['verdict']}")
+                print(f"Score: {result['score']}")
+                print(f"Summary: {result['summary']}")
+                print(f"Evidence Count: {len(result['evidence'])}")
+                print(f"LLM calls: {len(prompts)}\n")
+
+                assert result['verdict'] == 'false'
+                assert any('Break down the following claim' in p for p in prompts) == decomposed
+                assert len(prompts) == (2 if decomposed else 1)
+
+    await close_http()
 
 if __name__ == "__main__":
     asyncio.run(run_mock_test())
@@ -1,6 +1,7 @@
 import asyncio
 from app.agents.verifier import verify_claim_text
 from app.config import settings
+from app.http_client import close_http
 
 async def main():
     print(f"Testing with OpenAI Key: {settings.OPENAI_API_KEY[:5]}..." if settings.OPENAI_API_KEY else "No OpenAI Key")
@@ -17,5 +18,7 @@ async def main():
     for e in result['evidence']:
         print(f"- {e.get('source')}: {e.get('title')}")
 
+    await close_http()
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,59 @@
+# Trains the linear claim classifier used with CLAIM_EXTRACTOR=linear.
+# Input is JSONL with one labelled sentence per line:
+#   {"text": "The vaccine causes infertility", "label": 1}
+#   {"text": "Here is what we know so far", "label": 0}
+# Needs only numpy (no transformer model is loaded).
+#
+#   python train_claim_classifier.py labelled.jsonl --out data/claim_linear.npz
+
+import argparse
+import json
+import os
+import random
+from app.agents.claim_engine import LinearClaimModel
+
+def load(path):
+    texts, labels = [], []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                texts.append(row['text'])
+                labels.append(1 if row['label'] in (1, True, '1', 'claim') else 0)
+    return texts, labels
+
+def accuracy(model, texts, labels, threshold):
+    if not texts:
+        return float('nan')
+    scores = model.predict(texts)
+    return sum((p >= threshold) == bool(y) for p, y in zip(scores, labels)) / len(texts)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Train the hashed TF-IDF + logistic regression claim classifier')
+    parser.add_argument('data', help='JSONL file with text/label rows')
+    parser.add_argument('--out', default='data/claim_linear.npz')
+    parser.add_argument('--feature-bits', type=int, default=18, help='2**bits hashed features')
+    parser.add_argument('--epochs', type=int, default=300)
+    parser.add_argument('--lr', type=float, default=4.0)
+    parser.add_argument('--l2', type=float, default=1e-4)
+    parser.add_argument('--holdout', type=float, default=0.2, help='fraction kept for evaluation')
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rows = list(zip(*load(args.data)))
+    random.Random(args.seed).shuffle(rows)
+    cut = int(len(rows) * (1 - args.holdout))
+    train, test = rows[:cut], rows[cut:]
+    train_texts, train_labels = [r[0] for r in train], [r[1] for r in train]
+    model = LinearClaimModel.train(
+        train_texts, train_labels,
+        n_features=2 ** args.feature_bits, epochs=args.epochs, lr=args.lr, l2=args.l2,
+    )
+    print(f"{len(train)} training / {len(test)} held-out sentences")
+    print(f"train accuracy:    {accuracy(model, train_texts, train_labels, args.threshold):.3f}")
+    print(f"held-out accuracy: {accuracy(model, [r[0] for r in test], [r[1] for r in test], args.threshold):.3f}")
+
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    model.save(args.out)
+    print(f"Saved {args.out}")
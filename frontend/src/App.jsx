@@ -1,5 +1,16 @@
 import React, { useEffect, useState } from 'react'
-import { getClaims, getVerifications, getItems, verifyText } from './api'
+import { getClaims, getVerifications, getItems, verifyText, subscribeUpdates } from './api'
+
+const MAX_ROWS = 50
+
+// Inserts a new document at the top, or merges into the existing row with the same _id
+function upsert(list, doc) {
+    const i = list.findIndex(d => d._id === doc._id)
+    if (i === -1) return [doc, ...list].slice(0, MAX_ROWS)
+    const next = list.slice()
+    next[i] = { ...list[i], ...doc }
+    return next
+}
 
 export default function App() {
     const [claims, setClaims] = useState([])
@@ -13,8 +24,16 @@ export default function App() {
 
     useEffect(() => {
         fetchAll()
-        const iv = setInterval(fetchAll, 15000)
-        return () => clearInterval(iv)
+        // server pushes new items, claims and verifications; no polling
+        return subscribeUpdates({
+            onItem: doc => setItems(prev => upsert(prev, doc)),
+            onClaim: doc => setClaims(prev => upsert(prev, doc)),
+            onClaimStatus: ({ _id, status }) => setClaims(prev =>
+                prev.map(c => (c._id === _id ? { ...c, status } : c))
+            ),
+            onVerification: doc => setVers(prev => upsert(prev, doc)),
+            onReconnect: fetchAll,
+        })
     }, [])
 
     async function fetchAll() {
@@ -267,7 +286,7 @@ export default function App() {
 
                 {/* Footer */}
                 <footer className="mt-12 text-center text-gray-500 text-sm">
-                    <p>Powered by Advanced Agentic AI • Auto-refreshes every 15 seconds</p>
+                    <p>Powered by Advanced Agentic AI • Live updates</p>
                 </footer>
             </div>
         </div>
@@ -15,6 +15,31 @@ export async function verifyText(text) {
   return res.json()
 }
 
-export const getClaims = () => API.get('/claims').then(res => res.data);
-export const getVerifications = () => API.get('/verifications').then(res => res.data);
-export const getItems = () => API.get('/items').then(res => res.data);
+// the dashboard only needs the summary view (no article bodies, first 3 evidence links)
+const summary = { params: { view: 'summary' } };
+
+export const getClaims = () => API.get('/claims', summary).then(res => res.data);
+export const getVerifications = () => API.get('/verifications', summary).then(res => res.data);
+export const getItems = () => API.get('/items', summary).then(res => res.data);
+
+// Live deltas pushed by the backend over Server-Sent Events.
+// handlers: { onItem, onClaim, onClaimStatus, onVerification, onReconnect }
+export function subscribeUpdates(handlers) {
+  const source = new EventSource(`${API_BASE}/stream`);
+  const on = (type, handler) => {
+    if (handler) source.addEventListener(type, e => handler(JSON.parse(e.data)));
+  };
+  on('raw_item', handlers.onItem);
+  on('claim', handlers.onClaim);
+  on('claim_status', handlers.onClaimStatus);
+  on('verification', handlers.onVerification);
+
+  // EventSource reconnects by itself; reload once it is back to fill the gap
+  let dropped = false;
+  source.onerror = () => { dropped = true; };
+  source.onopen = () => {
+    if (dropped && handlers.onReconnect) handlers.onReconnect();
+    dropped = false;
+  };
+  return () => source.close();
+}